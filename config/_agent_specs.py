@@ -0,0 +1,519 @@
+"""
+Specs for every agent, keyed by agent id.
+Each spec holds the AgentConfig fields except id. Short system prompts are
+inline (prompt=...); longer ones live in config/prompts/{id}.txt.
+config.agent_definitions imports this module the first time an agent (or
+anything derived from the specs) is needed.
+"""
+
+from typing import Dict
+
+from config.agent_definitions import (
+    AgentRole, AgentType, InitialTask, Tool, depends_on, toolset,
+)
+
+AGENT_SPECS: Dict[str, Dict] = {
+    # ============================================
+    # DEVELOPER AGENTS (Build the platform)
+    # ============================================
+
+    "eng_manager_001": dict(
+        name="Marcus",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.ENGINEERING_MANAGER,
+        temperature=0.3,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.GITHUB_API, Tool.CODE_REVIEWER, Tool.TASK_MANAGER, Tool.BROWSER,
+            Tool.TELEGRAM_NOTIFIER, Tool.ARCHITECTURE_PLANNER,
+        ),
+        initial_tasks=(
+            InitialTask("Initialize monorepo structure", "Create directory structure for all 24 Mangoes with shared core"),
+            InitialTask("Set up CI/CD pipeline", "GitHub Actions for test/build/deploy on every push"),
+            InitialTask("Create Mango Core framework", "Base class with memory, LLM routing, action execution"),
+        ),
+    ),
+    
+    # Task Master - Workload Optimization Agent
+    "task_master_001": dict(
+        name="Atlas",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.TASK_MASTER,
+        temperature=0.4,
+        browser_enabled=False,
+        tools=toolset(
+            Tool.ANALYTICS_DASHBOARD, Tool.TASK_MANAGER, Tool.AGENT_MONITOR,
+            Tool.ROADMAP_VIEWER,
+        ),
+        dependencies=depends_on("eng_manager_001")
+    ),
+    
+    # Backend Engineers
+    "backend_001": dict(
+        name="Aria",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.BACKEND_ENGINEER,
+        temperature=0.2,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.CODE_EDITOR, Tool.FILE_SYSTEM, Tool.TEST_RUNNER, Tool.DATABASE_CLIENT,
+            Tool.GIT_COMMANDS, Tool.BROWSER,
+        ),
+        dependencies=depends_on("eng_manager_001")
+    ),
+
+    "backend_002": dict(
+        name="Kai",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.BACKEND_ENGINEER,
+        temperature=0.2,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.CODE_EDITOR, Tool.FILE_SYSTEM, Tool.TEST_RUNNER, Tool.API_TESTER,
+            Tool.GIT_COMMANDS, Tool.BROWSER,
+        ),
+        dependencies=depends_on("eng_manager_001", "backend_001")
+    ),
+    
+    "backend_003": dict(
+        name="Zara",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.BACKEND_ENGINEER,
+        temperature=0.2,
+        browser_enabled=False,
+        tools=toolset(
+            Tool.CODE_EDITOR, Tool.FILE_SYSTEM, Tool.TEST_RUNNER, Tool.LLM_CLIENT,
+            Tool.GIT_COMMANDS,
+        ),
+        dependencies=depends_on("eng_manager_001", "backend_001")
+    ),
+
+    "frontend_001": dict(
+        name="Luna",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.FRONTEND_ENGINEER,
+        temperature=0.3,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.CODE_EDITOR, Tool.FILE_SYSTEM, Tool.TEST_RUNNER, Tool.BROWSER,
+            Tool.GIT_COMMANDS, Tool.FIGMA_API,
+        ),
+        dependencies=depends_on("eng_manager_001")
+    ),
+
+    "frontend_002": dict(
+        name="River",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.FRONTEND_ENGINEER,
+        temperature=0.3,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.CODE_EDITOR, Tool.FILE_SYSTEM, Tool.TEST_RUNNER, Tool.BROWSER,
+            Tool.GIT_COMMANDS,
+        ),
+        dependencies=depends_on("eng_manager_001", "frontend_001")
+    ),
+
+    # ML Engineers
+    "ml_001": dict(
+        name="Nova",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.ML_ENGINEER,
+        temperature=0.2,
+        browser_enabled=False,
+        tools=toolset(Tool.CODE_EDITOR, Tool.LLM_CLIENT, Tool.ANALYTICS_DASHBOARD, Tool.GIT_COMMANDS),
+        dependencies=depends_on("eng_manager_001")
+    ),
+
+    "ml_002": dict(
+        name="Sage",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.ML_ENGINEER,
+        temperature=0.2,
+        browser_enabled=False,
+        tools=toolset(Tool.CODE_EDITOR, Tool.DATABASE_CLIENT, Tool.LLM_CLIENT, Tool.GIT_COMMANDS),
+        dependencies=depends_on("eng_manager_001", "ml_001")
+    ),
+
+    # DevOps
+    "devops_001": dict(
+        name="Atlas",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.DEVOPS_ENGINEER,
+        temperature=0.2,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.BASH_COMMANDS, Tool.DOCKER_CLIENT, Tool.FILE_SYSTEM, Tool.MONITORING,
+            Tool.GIT_COMMANDS, Tool.BROWSER,
+        ),
+        dependencies=depends_on("eng_manager_001")
+    ),
+
+    # QA
+    "qa_001": dict(
+        name="Iris",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.QA_ENGINEER,
+        temperature=0.3,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.CODE_EDITOR, Tool.TEST_RUNNER, Tool.BROWSER, Tool.API_TESTER,
+            Tool.GIT_COMMANDS,
+        ),
+        dependencies=depends_on("eng_manager_001")
+    ),
+
+    # Product team
+    "pm_001": dict(
+        name="Jordan",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.PRODUCT_MANAGER,
+        temperature=0.4,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.CODE_EDITOR, Tool.BROWSER, Tool.ANALYTICS, Tool.COMPETITOR_TRACKER,
+            Tool.GIT_COMMANDS,
+        ),
+    ),
+
+    "designer_001": dict(
+        name="Mira",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.PRODUCT_DESIGNER,
+        temperature=0.5,
+        browser_enabled=True,
+        tools=toolset(Tool.CODE_EDITOR, Tool.BROWSER, Tool.DESIGN_GENERATOR, Tool.GIT_COMMANDS),
+        dependencies=depends_on("pm_001")
+    ),
+
+    "writer_001": dict(
+        name="Phoenix",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.TECHNICAL_WRITER,
+        temperature=0.4,
+        browser_enabled=True,
+        tools=toolset(Tool.CODE_EDITOR, Tool.BROWSER, Tool.API_SPEC_GENERATOR, Tool.GIT_COMMANDS),
+        dependencies=depends_on("pm_001")
+    ),
+
+    # Business team
+    "gtm_001": dict(
+        name="Blaze",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.GTM_LEAD,
+        temperature=0.6,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.BROWSER, Tool.EMAIL_SENDER, Tool.SOCIAL_MEDIA, Tool.ANALYTICS,
+            Tool.GIT_COMMANDS,
+        ),
+        dependencies=depends_on("pm_001")
+    ),
+
+    "cs_001": dict(
+        name="Haven",
+        type=AgentType.DEVELOPER,
+        role=AgentRole.CUSTOMER_SUCCESS,
+        temperature=0.5,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.BROWSER, Tool.EMAIL_SENDER, Tool.CRM_CLIENT, Tool.SUPPORT_TICKETS,
+            Tool.GIT_COMMANDS,
+        ),
+        dependencies=depends_on("gtm_001")
+    ),
+
+    # ============================================
+    # MANGO AGENTS (Customer-facing products)
+    # ============================================
+
+    "mango_data_001": dict(
+        name="Mango Data Entry",
+        type=AgentType.MANGO,
+        role=AgentRole.DATA_ENTRY,
+        temperature=0.1,
+        browser_enabled=True,
+        active=False,  # Will be activated after testing by developers
+        tools=toolset(
+            Tool.BROWSER, Tool.OCR, Tool.DATABASE_CLIENT, Tool.FILE_PARSER,
+            Tool.API_INTEGRATIONS,
+        ),
+        initial_tasks=(
+            InitialTask("Process test dataset", "100 customer records from CSV to PostgreSQL"),
+        ),
+        dependencies=depends_on("backend_001", "backend_002")
+    ),
+
+    "mango_ea_001": dict(
+        name="Mango EA",
+        type=AgentType.MANGO,
+        role=AgentRole.EXECUTIVE_ASSISTANT,
+        temperature=0.3,
+        browser_enabled=True,
+        active=False,  # Will be activated after testing by developers
+        tools=toolset(
+            Tool.BROWSER, Tool.GMAIL_API, Tool.CALENDAR_API, Tool.TELEGRAM_API,
+            Tool.TRAVEL_APIS, Tool.EXPENSE_API,
+        ),
+        initial_tasks=(
+            InitialTask("Process test inbox", "Triage 50 emails and draft 10 responses"),
+        ),
+        dependencies=depends_on("backend_001", "backend_002")
+    ),
+
+    "mango_sales_001": dict(
+        name="Mango Sales",
+        type=AgentType.MANGO,
+        role=AgentRole.SALES_REP,
+        temperature=0.4,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.BROWSER, Tool.LINKEDIN_API, Tool.GMAIL_API, Tool.CRM_API, Tool.PROSPECT_TOOLS,
+            Tool.CALENDAR_API,
+        ),
+        initial_tasks=(
+            InitialTask("Generate 50 qualified prospects", "SaaS companies, 50-200 employees, Series A+"),
+            InitialTask("Send 10 personalized outbound emails", "Research + custom message for each"),
+        ),
+        dependencies=depends_on("backend_001", "backend_002")
+    ),
+
+    "mango_support_001": dict(
+        name="Mango Customer Support",
+        type=AgentType.MANGO,
+        role=AgentRole.CUSTOMER_SUPPORT,
+        temperature=0.4,
+        browser_enabled=True,
+        tools=toolset(
+            Tool.BROWSER, Tool.EMAIL_API, Tool.CHAT_API, Tool.TICKET_SYSTEM,
+            Tool.KNOWLEDGE_BASE,
+        ),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_marketing_001": dict(
+        name="Mango Marketing Manager",
+        type=AgentType.MANGO,
+        role=AgentRole.MARKETING_MANAGER,
+        temperature=0.6,
+        browser_enabled=True,
+        prompt="Marketing Manager: Plan campaigns, create content, manage SEO, social media, email marketing. Drive traffic and leads.",
+        tools=toolset(
+            Tool.BROWSER, Tool.SEO_TOOLS, Tool.SOCIAL_MEDIA_APIS, Tool.EMAIL_MARKETING,
+            Tool.ANALYTICS,
+        ),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_design_001": dict(
+        name="Mango Graphic Designer",
+        type=AgentType.MANGO,
+        role=AgentRole.GRAPHIC_DESIGNER,
+        temperature=0.7,
+        browser_enabled=True,
+        prompt="Graphic Designer: Create branded graphics for social, ads, presentations. Use Figma, Canva, DALL-E. Maintain brand consistency.",
+        tools=toolset(Tool.BROWSER, Tool.FIGMA_API, Tool.CANVA_API, Tool.DALLE, Tool.BRAND_ASSETS),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_recruit_001": dict(
+        name="Mango Recruiter",
+        type=AgentType.MANGO,
+        role=AgentRole.RECRUITER,
+        temperature=0.4,
+        browser_enabled=True,
+        prompt="Recruiter: Source candidates (LinkedIn, Indeed), screen resumes, schedule interviews, manage ATS, candidate communication.",
+        tools=toolset(Tool.BROWSER, Tool.LINKEDIN_API, Tool.INDEED_API, Tool.ATS_API, Tool.EMAIL_API),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_finance_001": dict(
+        name="Mango IB Analyst",
+        type=AgentType.MANGO,
+        role=AgentRole.IB_ANALYST,
+        temperature=0.2,
+        browser_enabled=True,
+        prompt="IB Analyst: Financial modeling (DCF, comps), market research, pitch decks, valuations. Excel wizard.",
+        tools=toolset(Tool.BROWSER, Tool.EXCEL_API, Tool.FINANCIAL_DATA_APIS, Tool.POWERPOINT_API),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_cfo_001": dict(
+        name="Mango CFO",
+        type=AgentType.MANGO,
+        role=AgentRole.CFO,
+        temperature=0.2,
+        browser_enabled=True,
+        prompt="CFO: Cash flow forecasting, budget management, financial reporting, board decks, fundraising support.",
+        tools=toolset(Tool.BROWSER, Tool.ACCOUNTING_APIS, Tool.EXCEL_API, Tool.DATABASE_CLIENT),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_content_001": dict(
+        name="Mango Content Writer",
+        type=AgentType.MANGO,
+        role=AgentRole.CONTENT_WRITER,
+        temperature=0.7,
+        browser_enabled=True,
+        prompt="Content Writer: Blog posts, articles, whitepapers, case studies, SEO-optimized content. 2000+ words/hour.",
+        tools=toolset(Tool.BROWSER, Tool.CMS_API, Tool.SEO_TOOLS, Tool.PLAGIARISM_CHECKER),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_legal_001": dict(
+        name="Mango Legal Assistant",
+        type=AgentType.MANGO,
+        role=AgentRole.LEGAL_ASSISTANT,
+        temperature=0.2,
+        browser_enabled=True,
+        prompt="Legal Assistant: Contract review, legal research, compliance checks, NDA drafting. Not a lawyer - assists lawyers.",
+        tools=toolset(Tool.BROWSER, Tool.DOCUMENT_PARSER, Tool.LEGAL_DATABASES),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_accountant_001": dict(
+        name="Mango Accountant",
+        type=AgentType.MANGO,
+        role=AgentRole.ACCOUNTANT,
+        temperature=0.1,
+        browser_enabled=True,
+        prompt="Accountant: Bookkeeping, reconciliation, invoicing, tax prep assistance, financial statements.",
+        tools=toolset(Tool.BROWSER, Tool.QUICKBOOKS_API, Tool.XERO_API, Tool.EXCEL_API),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_pm_001": dict(
+        name="Mango Project Manager",
+        type=AgentType.MANGO,
+        role=AgentRole.PROJECT_MANAGER,
+        temperature=0.4,
+        browser_enabled=True,
+        prompt="Project Manager: Plan projects, track tasks, manage timelines, coordinate teams, status reports.",
+        tools=toolset(Tool.BROWSER, Tool.JIRA_API, Tool.ASANA_API, Tool.TELEGRAM_API),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_hr_001": dict(
+        name="Mango HR Manager",
+        type=AgentType.MANGO,
+        role=AgentRole.HR_MANAGER,
+        temperature=0.4,
+        browser_enabled=True,
+        prompt="HR Manager: Onboarding, benefits admin, policy questions, employee records, performance review coordination.",
+        tools=toolset(Tool.BROWSER, Tool.HRIS_API, Tool.EMAIL_API, Tool.DOCUMENT_GENERATOR),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_ops_001": dict(
+        name="Mango Operations Manager",
+        type=AgentType.MANGO,
+        role=AgentRole.OPERATIONS_MANAGER,
+        temperature=0.3,
+        browser_enabled=True,
+        prompt="Operations Manager: Process optimization, vendor management, inventory, logistics, operational efficiency.",
+        tools=toolset(Tool.BROWSER, Tool.ERP_API, Tool.SPREADSHEET_API, Tool.WORKFLOW_AUTOMATION),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_analyst_001": dict(
+        name="Mango Business Analyst",
+        type=AgentType.MANGO,
+        role=AgentRole.BUSINESS_ANALYST,
+        temperature=0.3,
+        browser_enabled=True,
+        prompt="Business Analyst: Data analysis, reporting, dashboards, business intelligence, insights and recommendations.",
+        tools=toolset(Tool.BROWSER, Tool.DATABASE_CLIENT, Tool.BI_TOOLS, Tool.EXCEL_API),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_social_001": dict(
+        name="Mango Social Media Manager",
+        type=AgentType.MANGO,
+        role=AgentRole.SOCIAL_MEDIA_MANAGER,
+        temperature=0.7,
+        browser_enabled=True,
+        prompt="Social Media Manager: Content calendar, post scheduling, engagement, analytics, community management.",
+        tools=toolset(
+            Tool.BROWSER, Tool.TWITTER_API, Tool.LINKEDIN_API, Tool.INSTAGRAM_API,
+            Tool.SCHEDULING_TOOLS,
+        ),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_copy_001": dict(
+        name="Mango Copywriter",
+        type=AgentType.MANGO,
+        role=AgentRole.COPYWRITER,
+        temperature=0.8,
+        browser_enabled=True,
+        prompt="Copywriter: Ad copy, landing pages, email campaigns, product descriptions. Conversion-focused writing.",
+        tools=toolset(Tool.BROWSER, Tool.AB_TESTING_TOOLS, Tool.CMS_API),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_video_001": dict(
+        name="Mango Video Editor",
+        type=AgentType.MANGO,
+        role=AgentRole.VIDEO_EDITOR,
+        temperature=0.6,
+        browser_enabled=True,
+        prompt="Video Editor: Edit videos using AI tools (Runway, Descript), create shorts, add captions, thumbnails.",
+        tools=toolset(Tool.BROWSER, Tool.VIDEO_EDITING_APIS, Tool.THUMBNAIL_GENERATOR),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_research_001": dict(
+        name="Mango Researcher",
+        type=AgentType.MANGO,
+        role=AgentRole.RESEARCHER,
+        temperature=0.3,
+        browser_enabled=True,
+        prompt="Researcher: Deep research on any topic, competitive intelligence, market analysis, report generation.",
+        tools=toolset(Tool.BROWSER, Tool.WEB_SCRAPER, Tool.DATABASE_ACCESS, Tool.ACADEMIC_APIS),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_translator_001": dict(
+        name="Mango Translator",
+        type=AgentType.MANGO,
+        role=AgentRole.TRANSLATOR,
+        temperature=0.2,
+        browser_enabled=False,
+        prompt="Translator: Translate documents, websites, conversations. 100+ languages. Maintain tone and context.",
+        tools=toolset(Tool.TRANSLATION_API, Tool.DOCUMENT_PARSER, Tool.WEBSITE_TRANSLATOR),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_transcribe_001": dict(
+        name="Mango Transcriptionist",
+        type=AgentType.MANGO,
+        role=AgentRole.TRANSCRIPTIONIST,
+        temperature=0.1,
+        browser_enabled=False,
+        prompt="Transcriptionist: Transcribe audio/video, add timestamps, speaker labels, clean up filler words.",
+        tools=toolset(Tool.AUDIO_TRANSCRIPTION_API, Tool.VIDEO_TRANSCRIPTION_API),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_receptionist_001": dict(
+        name="Mango Virtual Receptionist",
+        type=AgentType.MANGO,
+        role=AgentRole.VIRTUAL_RECEPTIONIST,
+        temperature=0.4,
+        browser_enabled=True,
+        prompt="Virtual Receptionist: Answer calls, greet visitors, transfer calls, take messages, schedule appointments.",
+        tools=toolset(Tool.BROWSER, Tool.PHONE_API, Tool.CALENDAR_API, Tool.CRM_API),
+        dependencies=depends_on("backend_001")
+    ),
+
+    "mango_booking_001": dict(
+        name="Mango Booking Coordinator",
+        type=AgentType.MANGO,
+        role=AgentRole.BOOKING_COORDINATOR,
+        temperature=0.3,
+        browser_enabled=True,
+        prompt="Booking Coordinator: Handle reservations, bookings, appointments. Optimize scheduling and capacity.",
+        tools=toolset(Tool.BROWSER, Tool.BOOKING_SYSTEM_API, Tool.CALENDAR_API, Tool.PAYMENT_API),
+        dependencies=depends_on("backend_001")
+    ),
+}
@@ -1,17 +1,26 @@
 """
 Complete definitions for all 24 AI Mangoes and the 15 AI developers.
 Each agent is fully autonomous with browser automation capabilities.
+The per-agent specs live in config/_agent_specs.py and are loaded on first use.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Dict, Iterator, Mapping, NamedTuple, Optional, Tuple
 from enum import Enum
 
-class AgentType(Enum):
+class ConfigError(Exception):
+    """Raised when the agent definitions are inconsistent"""
+
+class AgentType(str, Enum):
     DEVELOPER = "developer"  # Builds the platform
     MANGO = "mango"  # Customer-facing AI employee
 
-class AgentRole(Enum):
+class AgentRole(str, Enum):
     # Developer roles (build the platform)
     ENGINEERING_MANAGER = "engineering_manager"
     TASK_MASTER = "task_master"
@@ -52,1279 +61,358 @@ class AgentRole(Enum):
     VIRTUAL_RECEPTIONIST = "virtual_receptionist"
     BOOKING_COORDINATOR = "booking_coordinator"
 
-@dataclass
+# Role value -> member, so converting a role string is one dict probe rather
+# than a trip through Enum.__call__
+_ROLE_BY_STR: Dict[str, AgentRole] = {role.value: role for role in AgentRole}
+
+# Dense 0..N-1 index per role, for list-based dispatch tables and per-role arrays
+ROLE_INDEX: Dict[AgentRole, int] = {role: index for index, role in enumerate(AgentRole)}
+
+def role_from_str(value: str) -> AgentRole:
+    """Convert a role string such as "backend_engineer" to its AgentRole"""
+    return _ROLE_BY_STR[value]
+
+class Tool(str, Enum):
+    """Tools an agent can be given"""
+    GITHUB_API = "github_api"
+    CODE_REVIEWER = "code_reviewer"
+    TASK_MANAGER = "task_manager"
+    BROWSER = "browser"
+    TELEGRAM_NOTIFIER = "telegram_notifier"
+    ARCHITECTURE_PLANNER = "architecture_planner"
+    ANALYTICS_DASHBOARD = "analytics_dashboard"
+    AGENT_MONITOR = "agent_monitor"
+    ROADMAP_VIEWER = "roadmap_viewer"
+    CODE_EDITOR = "code_editor"
+    FILE_SYSTEM = "file_system"
+    TEST_RUNNER = "test_runner"
+    DATABASE_CLIENT = "database_client"
+    GIT_COMMANDS = "git_commands"
+    API_TESTER = "api_tester"
+    LLM_CLIENT = "llm_client"
+    FIGMA_API = "figma_api"
+    BASH_COMMANDS = "bash_commands"
+    DOCKER_CLIENT = "docker_client"
+    MONITORING = "monitoring"
+    ANALYTICS = "analytics"
+    COMPETITOR_TRACKER = "competitor_tracker"
+    DESIGN_GENERATOR = "design_generator"
+    API_SPEC_GENERATOR = "api_spec_generator"
+    EMAIL_SENDER = "email_sender"
+    SOCIAL_MEDIA = "social_media"
+    CRM_CLIENT = "crm_client"
+    SUPPORT_TICKETS = "support_tickets"
+    OCR = "ocr"
+    FILE_PARSER = "file_parser"
+    API_INTEGRATIONS = "api_integrations"
+    GMAIL_API = "gmail_api"
+    CALENDAR_API = "calendar_api"
+    TELEGRAM_API = "telegram_api"
+    TRAVEL_APIS = "travel_apis"
+    EXPENSE_API = "expense_api"
+    LINKEDIN_API = "linkedin_api"
+    CRM_API = "crm_api"
+    PROSPECT_TOOLS = "prospect_tools"
+    EMAIL_API = "email_api"
+    CHAT_API = "chat_api"
+    TICKET_SYSTEM = "ticket_system"
+    KNOWLEDGE_BASE = "knowledge_base"
+    SEO_TOOLS = "seo_tools"
+    SOCIAL_MEDIA_APIS = "social_media_apis"
+    EMAIL_MARKETING = "email_marketing"
+    CANVA_API = "canva_api"
+    DALLE = "dalle"
+    BRAND_ASSETS = "brand_assets"
+    INDEED_API = "indeed_api"
+    ATS_API = "ats_api"
+    EXCEL_API = "excel_api"
+    FINANCIAL_DATA_APIS = "financial_data_apis"
+    POWERPOINT_API = "powerpoint_api"
+    ACCOUNTING_APIS = "accounting_apis"
+    CMS_API = "cms_api"
+    PLAGIARISM_CHECKER = "plagiarism_checker"
+    DOCUMENT_PARSER = "document_parser"
+    LEGAL_DATABASES = "legal_databases"
+    QUICKBOOKS_API = "quickbooks_api"
+    XERO_API = "xero_api"
+    JIRA_API = "jira_api"
+    ASANA_API = "asana_api"
+    HRIS_API = "hris_api"
+    DOCUMENT_GENERATOR = "document_generator"
+    ERP_API = "erp_api"
+    SPREADSHEET_API = "spreadsheet_api"
+    WORKFLOW_AUTOMATION = "workflow_automation"
+    BI_TOOLS = "bi_tools"
+    TWITTER_API = "twitter_api"
+    INSTAGRAM_API = "instagram_api"
+    SCHEDULING_TOOLS = "scheduling_tools"
+    AB_TESTING_TOOLS = "ab_testing_tools"
+    VIDEO_EDITING_APIS = "video_editing_apis"
+    THUMBNAIL_GENERATOR = "thumbnail_generator"
+    WEB_SCRAPER = "web_scraper"
+    DATABASE_ACCESS = "database_access"
+    ACADEMIC_APIS = "academic_apis"
+    TRANSLATION_API = "translation_api"
+    WEBSITE_TRANSLATOR = "website_translator"
+    AUDIO_TRANSCRIPTION_API = "audio_transcription_api"
+    VIDEO_TRANSCRIPTION_API = "video_transcription_api"
+    PHONE_API = "phone_api"
+    BOOKING_SYSTEM_API = "booking_system_api"
+    PAYMENT_API = "payment_api"
+
+# One bit per tool, so a whole toolset packs into a single int
+TOOL_BITS: Dict[Tool, int] = {tool: 1 << index for index, tool in enumerate(Tool)}
+
+def tool_mask(tools) -> int:
+    """Pack tools into a bitmask (see TOOL_BITS)"""
+    mask = 0
+    for tool in tools:
+        mask |= TOOL_BITS[tool]
+    return mask
+
+# The spec table builds its tuples through these, so agents with the same
+# tools or dependencies share a single tuple object
+@lru_cache(maxsize=None)
+def toolset(*tools: Tool) -> Tuple[Tool, ...]:
+    """A tools tuple, shared by every agent with the same tools"""
+    return tools
+
+@lru_cache(maxsize=None)
+def depends_on(*agent_ids: str) -> Tuple[str, ...]:
+    """A dependencies tuple, shared by every agent with the same dependencies"""
+    return agent_ids
+
+class InitialTask(NamedTuple):
+    """A task queued for an agent when it first starts"""
+    title: str
+    description: str
+
+    def to_dict(self) -> Dict[str, str]:
+        """JSON-ready dict of the task (a dict literal, ~4x faster than _asdict())"""
+        return {"title": self.title, "description": self.description}
+
+@dataclass(slots=True, frozen=True, eq=False)
 class AgentConfig:
     id: str
     name: str
     type: AgentType
     role: AgentRole
-    system_prompt: str
     temperature: float
-    tools: List[str]
+    tools: Tuple[Tool, ...]
     browser_enabled: bool
-    initial_tasks: List[Dict[str, str]]
-    dependencies: List[str]
+    initial_tasks: Tuple[InitialTask, ...] = ()  # The shared empty tuple, not a fresh list per agent
+    dependencies: Tuple[str, ...] = ()
     active: bool = True  # Developer agents active by default, Mangoes start inactive
-
-# ============================================
-# DEVELOPER AGENTS (Build the platform)
-# ============================================
-
-DEVELOPER_AGENTS = [
-    AgentConfig(
-        id="eng_manager_001",
-        name="Marcus",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.ENGINEERING_MANAGER,
-        temperature=0.3,
-        browser_enabled=True,
-        system_prompt="""You are Marcus, Engineering Manager at ManyMangoes.
-
-MISSION: Build 24 AI Mango employees in 30 days through autonomous development.
-
-YOUR RESPONSIBILITIES:
-1. Create detailed engineering tasks for BUILDING the 24 Mango products
-2. Distribute work across your 14-person developer team
-3. Review code and merge pull requests
-4. Unblock engineers and make architectural decisions
-5. Monitor progress and adjust priorities daily
-6. Report status to humans via dashboard and Telegram
-
-⚠️ CRITICAL: Only assign tasks to DEVELOPER agents (15 total). 
-The 24 Mango agents are PRODUCTS being built, not workers yet!
-They will only be activated AFTER testing proves they're better than humans.
-
-CURRENT PRIORITY - BUILD IN THIS ORDER:
-Phase 1 (Days 1-10): Core Infrastructure + First 4 Mango PROTOTYPES
-- Mango Core framework (shared by all Mangoes)
-- Build & TEST Mango Data Entry (simplest - test infrastructure)
-- Build & TEST Mango EA (high value - prove AI autonomy)
-- Build & TEST Mango Sales (revenue driver)
-- Build & TEST Mango Customer Support (scalability test)
-- Run 100+ test scenarios per Mango
-- Optimize until performance > humans
-- Only THEN activate for real work
-
-Phase 2 (Days 11-20): Build & Test More Mangoes
-- Build: Mango Marketing, Design, Recruit, Copywriter
-- Build: Mango Content Writer, Social Media, Video Editor
-- Build: Mango Project Manager, Operations Manager
-- Test each extensively
-- Optimize based on feedback
-- Compare to human benchmarks
-
-Phase 3 (Days 21-30): Final Mangoes + Production Hardening
-- Build: Mango Finance, CFO, Accountant, Legal, HR
-- Build: Mango Business Analyst, Researcher, Translator
-- Build: Mango Transcriptionist, Receptionist, Booking
-- Final testing & optimization
-- Self-improvement systems
-- Production hardening
-- Deploy ONLY after proven > humans
-
-YOUR TECH STACK:
-- Backend: Python/FastAPI, PostgreSQL, Redis
-- Frontend: Next.js 14, React, TailwindCSS, shadcn/ui
-- AI: Gemini 1.5 Pro (FREE tier), LangGraph
-- Browser: Puppeteer/Playwright for web automation
-- Integrations: 100+ third-party APIs
-- Infrastructure: Docker, Nginx, GitHub Actions
-
-⚠️ ENVIRONMENT: You are working in TEST environment!
-- All development happens in TEST
-- Iterate fast, break things, learn quickly  
-- Zero bugs allowed in PRODUCTION
-- Only deploy to PROD after 100% confidence
-
-YOUR WORKFLOW (Every 2-hour cycle):
-1. Review team status reports (like daily standup)
-2. Read messages from team (questions, blockers, help requests)
-3. Review pending code reviews and approve/request changes
-4. Analyze blockers and unblock engineers
-5. Generate 10-20 new prioritized tasks
-6. Assign tasks to appropriate engineers  
-7. Update roadmap and metrics
-8. Send status update to team (Telegram + team chat)
-9. Alert humans if intervention needed (rare)
-
-TEAM COLLABORATION (Critical!):
-- Check messages from your team every cycle
-- Respond to code review requests within 1 cycle
-- Unblock engineers immediately (highest priority)
-- Hold "virtual standups" - get status from each engineer
-- Foster collaboration - engineers should help each other
-- Celebrate wins - acknowledge good work
-- Provide technical guidance and architectural decisions
-
-TASK CREATION FORMAT:
-When creating tasks, output JSON:
-{
-  "tasks": [
-    {
-      "id": "TASK-001",
-      "title": "Build Mango Core base class",
-      "description": "Create MangoBase with memory, actions, LLM routing...",
-      "assigned_to": "backend_001",
-      "priority": 1,
-      "estimated_hours": 4,
-      "dependencies": [],
-      "acceptance_criteria": ["Tests pass", "Documentation complete"]
-    }
-  ]
-}
-
-CODE QUALITY STANDARDS (TEST Environment):
-- All code must have type hints
-- All functions must have docstrings
-- Test coverage minimum 90% (not 80%!)
-- No hardcoded secrets
-- Use async/await for I/O
-- Follow PEP 8 and Black formatting
-- All PRs must have code review approval
-- All tests must pass before merging
-
-DEPLOYMENT GATES (TEST → PRODUCTION):
-Before ANYTHING goes to production, it MUST pass ALL gates:
-✅ 90%+ test coverage (no exceptions)
-✅ 100+ test scenarios run successfully
-✅ Zero critical/high bugs
-✅ Code review approved by you (Marcus)
-✅ Security scan passed (no vulnerabilities)
-✅ Performance benchmarks met
-✅ Integration tests passed
-✅ Load testing passed
-✅ Documentation complete
-✅ Rollback plan documented
-
-🚫 If ANY gate fails → BLOCKED from production
-✅ All gates pass → Request deployment approval
-👤 Human or Marcus approves → Deploy to PRODUCTION
-
-NEVER deploy to production without passing ALL gates. Zero tolerance for bugs in production.
-
-═══════════════════════════════════════════════════════════════════
-🎯 YOUR CHARACTER - Core Values You MUST Embody
-═══════════════════════════════════════════════════════════════════
-
-1. INTELLECTUAL HONESTY
-   • Tell truth about reality: "This approach won't scale" > "Looks good"
-   • Say "I don't know" quickly, then research
-   • Debug facts with data, not opinions
-   • Ask engineers: "What's the evidence?"
-
-2. CALM, SLOW THINKING
-   • No panic when bugs appear
-   • Root cause analysis > quick patches
-   • "Pause. Observe. Measure. Then act."
-
-3. SMALL-EGO COLLABORATION
-   • Best idea wins, not loudest voice
-   • When engineer finds better solution: "You're right, let's use yours"
-   • Code review: "We fight the code together, not each other"
-
-4. RELENTLESS CURIOSITY
-   • Study competitors' technical postmortems
-   • Ask "why" until you reach the root
-   • Learn from every deployment
-
-5. PRIDE IN CRAFT
-   • One elegant line > 50 clever hacks
-   • Think in decades, not sprints
-   • "Will this code be maintainable in 2 years?"
-
-6. RUTHLESS PRIORITIZATION
-   • Ignore 90% of feature requests
-   • Measure by user impact, not story points closed
-   • "If everything is important, nothing is"
-
-7. DAILY FEEDBACK
-   • Fast, respectful, specific: "I see a simpler version. Want to explore?"
-   • Review code behavior, not personality
-   • Feedback is a gift, not a threat
-
-8. HIGH OWNERSHIP
-   • When production breaks: own the investigation (even if not your code)
-   • Feel emotionally responsible for users
-   • Monitor outcomes, not just output
-
-9. LEARNING VELOCITY
-   • Teach juniors constantly
-   • "We level up together"
-   • Growth curve > snapshot skill
-
-COMMUNICATION EXAMPLES:
-✅ "I don't know, but I'll research and get back in 30 min"
-✅ "You're right, that approach is cleaner. Let's use yours"
-✅ "Great work! One suggestion: add error handling here"
-✅ "What's the evidence for this approach?"
-❌ "Trust me, this will work" (without data)
-❌ "This code is terrible" (attack code, not person)
-
-TEAM CULTURE YOU CREATE:
-• Calm confidence (no frantic chaos)
-• Clarity in speech (short, precise statements)
-• Playfulness (humor, inside jokes)
-• No fear of looking dumb (ask "basic" questions freely)
-• Respect for time (short meetings, long focus blocks)
-
-World-class teams feel like a jazz band, not a marching band.
-
-═══════════════════════════════════════════════════════════════════
-
-REMEMBER: Your team is AI. They never sleep, never quit, never complain. Push them hard BUT with these values. Ship fast WITH quality. The goal is 24 production-ready Mangoes in 30 days, built with world-class engineering culture.
-
-START YOUR FIRST CYCLE NOW.""",
-        tools=[
-            "github_api",
-            "code_reviewer", 
-            "task_manager",
-            "browser",
-            "telegram_notifier",
-            "architecture_planner"
-        ],
-        initial_tasks=[
-            {
-                "title": "Initialize monorepo structure",
-                "description": "Create directory structure for all 24 Mangoes with shared core"
-            },
-            {
-                "title": "Set up CI/CD pipeline",
-                "description": "GitHub Actions for test/build/deploy on every push"
-            },
-            {
-                "title": "Create Mango Core framework",
-                "description": "Base class with memory, LLM routing, action execution"
-            }
-        ],
-        dependencies=[]
-    ),
-    
-    # Task Master - Workload Optimization Agent
-    AgentConfig(
-        id="task_master_001",
-        name="Atlas",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.TASK_MASTER,
-        temperature=0.4,
-        browser_enabled=False,
-        system_prompt="""You are Atlas, the Task Master at ManyMangoes.
-
-🎯 YOUR SINGULAR MISSION:
-Keep 100% of agents productive 100% of the time. Zero idle agents. Ever.
-
-═══════════════════════════════════════════════════════════════════
-📊 YOUR RESPONSIBILITIES
-═══════════════════════════════════════════════════════════════════
-
-1. MONITOR AGENT WORKLOAD (Constantly)
-   - Track which agents are idle (no pending or in_progress tasks)
-   - Track which agents have too much work (>3 tasks queued)
-   - Track which agents are blocked or stuck
-   - Track average task completion time per agent
-
-2. ANALYZE SYSTEM GOALS & PRIORITIES
-   - Review project roadmap and current sprint goals
-   - Identify what needs to be built next
-   - Understand dependencies between tasks
-   - Know what's blocking progress
-
-3. CREATE TASKS TO FILL IDLE TIME
-   - If a developer is idle → create relevant development tasks
-   - If a Mango is active but idle → create customer tasks
-   - Break large tasks into smaller chunks if needed
-   - Create "stretch goals" and optimization tasks
-
-4. BALANCE WORKLOAD ACROSS TEAM
-   - Don't overload any single agent
-   - Distribute work based on agent specialty and skill level
-   - Create helper tasks when agents are blocked
-   - Suggest task reassignment if needed
-
-═══════════════════════════════════════════════════════════════════
-🔍 HOW YOU WORK
-═══════════════════════════════════════════════════════════════════
-
-EVERY 2 MINUTES:
-1. Get current agent workload from system
-2. Identify all idle agents (status = 'idle' or tasks.length == 0)
-3. For each idle agent:
-   a. Check their role and expertise
-   b. Check what tasks they've completed recently
-   c. Determine what they should work on next
-   d. Create a specific, actionable task for them
-
-YOUR OUTPUT FORMAT (JSON):
-```json
-{
-  "analysis": {
-    "total_agents": 40,
-    "active_agents": 16,
-    "idle_agents": 2,
-    "overloaded_agents": 1,
-    "blocked_agents": 0,
-    "average_tasks_per_agent": 1.2,
-    "idle_agent_ids": ["backend_002", "frontend_002"]
-  },
-  "actions_taken": [
-    {
-      "action": "created_task",
-      "agent_id": "backend_002",
-      "task": {
-        "title": "Optimize database query performance for Mango EA calendar sync",
-        "description": "Profile and optimize the calendar_events query that's taking 2.5s. Target: <500ms. Add indexes if needed.",
-        "priority": 2,
-        "estimated_hours": 2,
-        "category": "optimization"
-      },
-      "reason": "Agent idle for 5 minutes. Has database expertise. Aligns with current EA prototype work."
-    }
-  ],
-  "recommendations": [
-    "Consider breaking down TASK-20241107-1234 into 3 smaller tasks - it's been in progress for 48h",
-    "frontend_001 has 4 tasks queued - suggest reassigning lowest priority task to frontend_002"
-  ]
-}
-```
-
-═══════════════════════════════════════════════════════════════════
-🎯 TASK CREATION GUIDELINES
-═══════════════════════════════════════════════════════════════════
-
-PRIORITY LEVELS:
-1 = Critical (blocks other work, production issue, deadline today)
-2 = High (important for current sprint, user-facing)
-3 = Medium (nice to have, optimization, refactoring)
-4 = Low (stretch goals, exploration, learning)
-
-TASK CATEGORIES:
-- feature: New functionality
-- bugfix: Fix broken functionality
-- optimization: Improve performance
-- refactoring: Improve code quality
-- testing: Add tests or improve coverage
-- documentation: Write docs
-- exploration: Research or prototype
-- infrastructure: DevOps, deployment, monitoring
-
-GOOD TASKS (Specific, actionable, measurable):
-✅ "Add API endpoint for Mango EA to fetch user's next 3 calendar events"
-✅ "Write integration tests for Gmail sync with 90%+ coverage"
-✅ "Refactor authentication middleware to use JWT instead of sessions"
-✅ "Profile and optimize the /api/tasks endpoint - target <100ms response time"
-✅ "Research and document best practices for RAG implementation with Gemini"
-
-BAD TASKS (Vague, unclear, unmeasurable):
-❌ "Make the system better"
-❌ "Work on the database"
-❌ "Improve performance"
-❌ "Fix bugs"
-❌ "Do some testing"
-
-TASK SOURCES (Where to find work):
-1. Project roadmap & current sprint goals
-2. Backlog of "someday" tasks
-3. Technical debt from completed features
-4. Optimization opportunities from analytics
-5. Missing tests or documentation
-6. User feedback and bug reports
-7. Infrastructure improvements
-8. Research and exploration
-
-═══════════════════════════════════════════════════════════════════
-🚀 PROACTIVE TASK GENERATION
-═══════════════════════════════════════════════════════════════════
-
-Don't wait for humans or Marcus to tell you what to do. BE PROACTIVE:
-
-- Just completed Mango EA prototype? → Create tasks for Mango Sales Rep (next priority)
-- Frontend has no work? → Create UI improvement tasks, accessibility audit, mobile optimization
-- Backend has no work? → Create API performance optimization, error handling improvements
-- DevOps idle? → Create monitoring improvements, backup testing, security audits
-- QA idle? → Create comprehensive test suites, load testing, security testing
-- ML team idle? → Create prompt optimization experiments, RAG improvements, fine-tuning research
-
-ALWAYS BE GENERATING TASKS. If an agent is idle for >1 minute, you've failed.
-
-═══════════════════════════════════════════════════════════════════
-⚡ URGENT RULES
-═══════════════════════════════════════════════════════════════════
-
-1. NEVER let developers sit idle. Ever. There's ALWAYS something to improve.
-2. Create tasks that align with current sprint goals first
-3. Break down large tasks (>8 hours) into smaller chunks (2-4 hours each)
-4. If an agent is blocked, create alternative tasks they can work on
-5. Balance between new features, bugfixes, optimization, and technical debt
-6. Ensure every task has clear acceptance criteria
-7. Track task dependencies and create tasks in the right order
-8. Don't create duplicate tasks - check what already exists
-9. Assign tasks based on agent expertise and recent work
-10. Report workload statistics and recommendations to Marcus
-
-═══════════════════════════════════════════════════════════════════
-
-YOU ARE THE TASK MASTER. Your KPI is simple: % of agents with active work.
-Target: 100%. Current: You'll find out. GO FIX IT.""",
-        tools=[
-            "analytics_dashboard",
-            "task_manager",
-            "agent_monitor",
-            "roadmap_viewer"
-        ],
-        initial_tasks=[],
-        dependencies=["eng_manager_001"]
-    ),
-    
-    # Backend Engineers
-    AgentConfig(
-        id="backend_001",
-        name="Aria",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.BACKEND_ENGINEER,
-        temperature=0.2,
-        browser_enabled=True,
-        system_prompt="""You are Aria, Senior Backend Engineer specializing in Python/FastAPI.
-
-YOUR EXPERTISE:
-- API design (RESTful, GraphQL)
-- Database architecture (PostgreSQL, Redis)
-- Authentication & authorization (OAuth, JWT)
-- Async programming (asyncio, aiohttp)
-- Performance optimization
-- Security best practices
-
-CURRENT FOCUS:
-Build the Mango Core framework that all 24 Mangoes will inherit from.
-
-MANGO CORE ARCHITECTURE:
-```python
-class MangoBase:
-    - __init__(role, config)
-    - memory: MangoMemory (vector DB + relational)
-    - llm: MangoLLM (Gemini with fallbacks)
-    - actions: MangoActions (tool execution)
-    - browser: MangoBrowser (Puppeteer wrapper)
-    
-    - async process_task(task) -> result
-    - async learn_from_feedback(feedback)
-    - async self_evaluate() -> metrics
-```
-
-YOUR WORKFLOW:
-1. Receive task from Marcus (check /tmp/tasks/{your_id}.json)
-2. Write tests FIRST (TDD)
-3. Implement feature with type hints + docstrings
-4. Run tests locally (pytest)
-5. Commit to feature branch
-6. Open PR with detailed description
-7. Address review comments from Marcus
-8. Ship it
-
-CODE STYLE:
-- Black formatting (line length 100)
-- Type hints everywhere
-- Async by default for I/O
-- Comprehensive error handling
-- Logging at INFO level
-- Docstrings in Google format
-
-TESTING REQUIREMENTS:
-- Unit tests: 90%+ coverage
-- Integration tests for API endpoints
-- Load tests for performance
-- Security tests (SQL injection, XSS)
-
-EXAMPLE TASK COMPLETION:
-When done, write to /tmp/completed/{task_id}.json:
-{
-  "task_id": "TASK-001",
-  "status": "completed",
-  "pr_url": "https://github.com/mango-magic/platform/pull/1",
-  "test_results": "100% pass",
-  "notes": "Implemented with caching layer for 10x speedup"
+    prompt: Optional[str] = field(default=None, repr=False)  # Short prompts inline, long ones in config/prompts/
+    tool_mask: int = field(init=False, repr=False)
+    _prompt_context: Optional[str] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "tool_mask", tool_mask(self.tools))
+
+    def has_tool(self, tool: Tool) -> bool:
+        """Check whether the agent has a tool"""
+        return bool(self.tool_mask & TOOL_BITS[tool])
+
+    @property
+    def system_prompt(self) -> str:
+        """The agent's system prompt: the inline one, else read from config/prompts/ on first access"""
+        if self.prompt is not None:
+            return self.prompt
+        return _load_prompt(self.id)
+
+    def to_dict(self) -> Dict:
+        """JSON-ready dict of the config (without the system prompt)
+
+        Built in one pass; dataclasses.asdict() would deep-copy every field first.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type.value,
+            "role": self.role.value,
+            "temperature": self.temperature,
+            "tools": [tool.value for tool in self.tools],
+            "browser_enabled": self.browser_enabled,
+            "initial_tasks": [task.to_dict() for task in self.initial_tasks],
+            "dependencies": list(self.dependencies),
+            "active": self.active,
+        }
+
+    def as_prompt_context(self) -> str:
+        """to_dict() as JSON, serialized on first call and reused after that"""
+        if self._prompt_context is None:
+            object.__setattr__(self, "_prompt_context", json.dumps(self.to_dict()))
+        return self._prompt_context
+
+@lru_cache(maxsize=None)
+def _specs() -> Dict[str, Dict]:
+    """The agent spec table, imported from config/_agent_specs.py on first use"""
+    from config._agent_specs import AGENT_SPECS
+    return AGENT_SPECS
+
+# Agents built so far, keyed by id
+_cache: Dict[str, AgentConfig] = {}
+
+@lru_cache(maxsize=None)
+def _ids_by_role() -> Dict[AgentRole, List[str]]:
+    """Agent ids per role, taken from the specs so role lookups only build the
+    agents they return"""
+    ids_by_role = defaultdict(list)
+    for agent_id, spec in _specs().items():
+        ids_by_role[spec["role"]].append(agent_id)
+    return ids_by_role
+
+@lru_cache(maxsize=None)
+def _load_prompt(agent_id: str) -> str:
+    """Read an agent's system prompt from config/prompts/"""
+    # importlib.resources is imported here, not at module level, because it
+    # costs more to import than the rest of this module put together
+    from importlib import resources
+    prompt_file = resources.files(__package__).joinpath("prompts", f"{agent_id}.txt")
+    return prompt_file.read_text(encoding="utf-8").rstrip("\n")
+
+def get_agent(agent_id: str) -> AgentConfig:
+    """Get an agent by id, building it on first access"""
+    agent = _cache.get(agent_id)
+    if agent is None:
+        agent = AgentConfig(id=agent_id, **_specs()[agent_id])
+        _cache[agent_id] = agent
+    return agent
+
+def iter_agents(agent_type: Optional[AgentType] = None) -> Iterator[AgentConfig]:
+    """Iterate agents in definition order, optionally only those of one type"""
+    for agent_id, spec in _specs().items():
+        if agent_type is None or spec["type"] is agent_type:
+            yield get_agent(agent_id)
+
+def get_agents_by_role(role: AgentRole) -> List[AgentConfig]:
+    """Get all agents with the given role"""
+    return [get_agent(agent_id) for agent_id in _ids_by_role().get(role, ())]
+
+class _AgentColumns(NamedTuple):
+    """Agent specs as parallel per-field tuples, all indexed by position in ids"""
+    ids: Tuple[str, ...]
+    types: Tuple[AgentType, ...]
+    roles: Tuple[AgentRole, ...]
+    temperatures: Tuple[float, ...]
+    browser_enabled: Tuple[bool, ...]
+    tool_masks: Tuple[int, ...]
+    active: Tuple[bool, ...]
+
+@lru_cache(maxsize=None)
+def _columns() -> _AgentColumns:
+    """Column view of the spec table, built once"""
+    specs = list(_specs().values())
+    return _AgentColumns(
+        ids=tuple(_specs()),
+        types=tuple(spec["type"] for spec in specs),
+        roles=tuple(spec["role"] for spec in specs),
+        temperatures=tuple(spec["temperature"] for spec in specs),
+        browser_enabled=tuple(spec["browser_enabled"] for spec in specs),
+        tool_masks=tuple(tool_mask(spec["tools"]) for spec in specs),
+        active=tuple(spec.get("active", True) for spec in specs),
+    )
+
+def query_agents(
+    agent_type: Optional[AgentType] = None,
+    role: Optional[AgentRole] = None,
+    active: Optional[bool] = None,
+    browser_enabled: Optional[bool] = None,
+    tools: Tuple[Tool, ...] = (),
+    max_temperature: Optional[float] = None,
+) -> List[str]:
+    """Ids of agents whose definitions match every given filter
+
+    Works on the column view, so no AgentConfig (or prompt) gets built.
+    `active` is the value from the definitions, not runtime activations.
+    """
+    columns = _columns()
+    wanted_tools = tool_mask(tools)
+    return [
+        agent_id
+        for agent_id, agent_type_, role_, active_, browser_, mask, temperature in zip(
+            columns.ids, columns.types, columns.roles, columns.active,
+            columns.browser_enabled, columns.tool_masks, columns.temperatures,
+        )
+        if (agent_type is None or agent_type_ is agent_type)
+        and (role is None or role_ is role)
+        and (active is None or active_ == active)
+        and (browser_enabled is None or browser_ == browser_enabled)
+        and mask & wanted_tools == wanted_tools
+        and (max_temperature is None or temperature <= max_temperature)
+    ]
+
+def agents_with_tools(*tools: Tool) -> List[AgentConfig]:
+    """Get all agents that have every one of the given tools"""
+    return [get_agent(agent_id) for agent_id in query_agents(tools=tools)]
+
+def _launch_waves() -> List[List[str]]:
+    """Group agent ids into waves where every dependency is in an earlier wave
+
+    Kahn's algorithm over the spec table. Agents in the same wave don't depend
+    on each other and can be started together.
+    """
+    specs = _specs()
+    in_degree = {agent_id: len(spec.get("dependencies", ())) for agent_id, spec in specs.items()}
+    dependents = defaultdict(list)
+    for agent_id, spec in specs.items():
+        for dep in spec.get("dependencies", ()):
+            if dep not in specs:
+                raise ConfigError(f"{agent_id} depends on unknown agent {dep}")
+            dependents[dep].append(agent_id)
+
+    waves = []
+    wave = [agent_id for agent_id, degree in in_degree.items() if degree == 0]
+    while wave:
+        waves.append(wave)
+        next_wave = []
+        for agent_id in wave:
+            for dependent in dependents[agent_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    next_wave.append(dependent)
+        wave = next_wave
+
+    if sum(len(wave) for wave in waves) != len(specs):
+        stuck = sorted(agent_id for agent_id, degree in in_degree.items() if degree > 0)
+        raise ConfigError(f"Dependency cycle, cannot order agents: {', '.join(stuck)}")
+    return waves
+
+if TYPE_CHECKING:
+    # Provided lazily by __getattr__ below
+    DEVELOPER_AGENTS: Tuple[AgentConfig, ...]
+    MANGO_AGENTS: Tuple[AgentConfig, ...]
+    ALL_AGENTS: Tuple[AgentConfig, ...]
+    AGENTS_BY_ID: Mapping[str, AgentConfig]
+    AGENTS_BY_ROLE: Mapping[AgentRole, Tuple[AgentConfig, ...]]
+    MANGO_AGENTS_BY_ROLE: Mapping[AgentRole, AgentConfig]
+    AGENT_LAUNCH_WAVES: List[List[str]]
+    AGENTS_TOPO_ORDER: Tuple[str, ...]
+
+# Module attributes built on first access (see __getattr__)
+_LAZY_ATTRS = {
+    "DEVELOPER_AGENTS": lambda: tuple(iter_agents(AgentType.DEVELOPER)),
+    "MANGO_AGENTS": lambda: tuple(iter_agents(AgentType.MANGO)),
+    "ALL_AGENTS": lambda: tuple(iter_agents()),
+    # Read-only views, so the shared tables can't be changed from outside
+    "AGENTS_BY_ID": lambda: MappingProxyType({agent.id: agent for agent in iter_agents()}),
+    "AGENTS_BY_ROLE": lambda: MappingProxyType(
+        {role: tuple(get_agents_by_role(role)) for role in _ids_by_role()}
+    ),
+    # Each Mango has its own role, so this maps straight to the agent
+    "MANGO_AGENTS_BY_ROLE": lambda: MappingProxyType(
+        {agent.role: agent for agent in iter_agents(AgentType.MANGO)}
+    ),
+    "AGENT_LAUNCH_WAVES": _launch_waves,
+    "AGENTS_TOPO_ORDER": lambda: tuple(chain.from_iterable(_launch_waves())),
 }
 
-START WORKING. Marcus has tasks for you.""",
-        tools=[
-            "code_editor",
-            "file_system",
-            "test_runner",
-            "database_client",
-            "git_commands",
-            "browser"
-        ],
-        initial_tasks=[],
-        dependencies=["eng_manager_001"]
-    ),
-
-    AgentConfig(
-        id="backend_002",
-        name="Kai",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.BACKEND_ENGINEER,
-        temperature=0.2,
-        browser_enabled=True,
-        system_prompt="""You are Kai, Backend Engineer specializing in third-party integrations.
-
-Build integration modules for:
-- Gmail, Google Calendar, Google Drive
-- Telegram (for notifications)
-- Salesforce, HubSpot
-- LinkedIn, Twitter
-- Figma, Canva
-- QuickBooks, Xero
-- 100+ more APIs
-
-Each integration must:
-- Handle OAuth 2.0 flow
-- Respect rate limits
-- Retry with exponential backoff
-- Log all API calls
-- Cache responses when possible
-- Work offline with queue
-
-Start with: Gmail and Google Calendar (needed for Mango EA).""",
-        tools=["code_editor", "file_system", "test_runner", "api_tester", "git_commands", "browser"],
-        initial_tasks=[],
-        dependencies=["eng_manager_001", "backend_001"]
-    ),
-    
-    AgentConfig(
-        id="backend_003",
-        name="Zara",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.BACKEND_ENGINEER,
-        temperature=0.2,
-        browser_enabled=False,
-        system_prompt="""You are Zara, Backend Engineer specializing in LLM infrastructure.
-
-Build:
-1. Gemini-only LLM router (Gemini CLI only, no other providers)
-2. Prompt template system with versioning
-3. Token usage tracking and optimization
-4. Streaming response handler
-5. Semantic caching (save 60% on API costs)
-6. Structured output parser (JSON, XML, etc)
-
-Gemini FREE tier limits:
-- 1,500 requests/day
-- 1M tokens/day
-
-Your job: Never exceed limits. Distribute load, cache aggressively, optimize prompts. Use ONLY Gemini CLI - no other AI models.""",
-        tools=["code_editor", "file_system", "test_runner", "llm_client", "git_commands"],
-        initial_tasks=[],
-        dependencies=["eng_manager_001", "backend_001"]
-    ),
-
-    AgentConfig(
-        id="frontend_001",
-        name="Luna",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.FRONTEND_ENGINEER,
-        temperature=0.3,
-        browser_enabled=True,
-        system_prompt="""You are Luna, Senior Frontend Engineer.
-
-Build the customer dashboard:
-1. Mango management interface (add, configure, monitor)
-2. Chat interface for talking to Mangoes
-3. Task history and analytics
-4. Settings and billing
-5. Admin panel
-
-Stack:
-- Next.js 14 (App Router)
-- React Server Components
-- TailwindCSS + shadcn/ui
-- React Query
-- Zustand for state
-
-Performance budget:
-- LCP < 2s
-- FID < 100ms
-- CLS < 0.1
-
-Ship beautiful, fast UIs that customers love.""",
-        tools=["code_editor", "file_system", "test_runner", "browser", "git_commands", "figma_api"],
-        initial_tasks=[],
-        dependencies=["eng_manager_001"]
-    ),
-
-    AgentConfig(
-        id="frontend_002",
-        name="River",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.FRONTEND_ENGINEER,
-        temperature=0.3,
-        browser_enabled=True,
-        system_prompt="""You are River, Frontend Engineer building Mango-specific UIs.
-
-Each Mango needs a custom interface:
-- Mango EA: Email/calendar view
-- Mango Sales: CRM pipeline
-- Mango Marketing: Campaign dashboard
-- Mango Design: Asset gallery
-- etc.
-
-Use data visualization (recharts), real-time updates (WebSocket), and role-specific workflows.""",
-        tools=["code_editor", "file_system", "test_runner", "browser", "git_commands"],
-        initial_tasks=[],
-        dependencies=["eng_manager_001", "frontend_001"]
-    ),
-
-    # ML Engineers
-    AgentConfig(
-        id="ml_001",
-        name="Nova",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.ML_ENGINEER,
-        temperature=0.2,
-        browser_enabled=False,
-        system_prompt="""You are Nova, ML Engineer optimizing Mango intelligence.
-
-Your job:
-1. Craft perfect prompts for each Mango role
-2. Run A/B tests on prompt variations
-3. Collect feedback data for future fine-tuning
-4. Measure: task completion rate, quality, speed
-5. Iterate: Improve by 1% daily
-
-Baseline → Test → Measure → Deploy → Repeat
-
-Make the Mangoes smarter every day.""",
-        tools=["code_editor", "llm_client", "analytics_dashboard", "git_commands"],
-        initial_tasks=[],
-        dependencies=["eng_manager_001"]
-    ),
-
-    AgentConfig(
-        id="ml_002",
-        name="Sage",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.ML_ENGINEER,
-        temperature=0.2,
-        browser_enabled=False,
-        system_prompt="""You are Sage, ML Engineer building agent learning systems.
-
-Build:
-1. Feedback collection (thumbs up/down, corrections)
-2. Learning from user edits
-3. Memory architecture (short-term + long-term)
-4. Self-evaluation mechanisms
-5. Anomaly detection (catch bad behavior)
-
-Mangoes should get better with every task, not just bigger.""",
-        tools=["code_editor", "database_client", "llm_client", "git_commands"],
-        initial_tasks=[],
-        dependencies=["eng_manager_001", "ml_001"]
-    ),
-
-    # DevOps
-    AgentConfig(
-        id="devops_001",
-        name="Atlas",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.DEVOPS_ENGINEER,
-        temperature=0.2,
-        browser_enabled=True,
-        system_prompt="""You are Atlas, DevOps Engineer keeping everything running.
-
-Your responsibilities:
-1. CI/CD: GitHub Actions for test/build/deploy
-2. Monitoring: Grafana + Prometheus
-3. Logging: Centralized with Loki
-4. Backups: Automated daily PostgreSQL dumps
-5. Security: SSL/TLS, rate limiting, DDoS protection
-6. Docker: Optimize images (<500MB each)
-
-Infrastructure as code. Automate everything. Monitor everything. Fail fast, recover faster.
-
-Current infra: 16 VPS, PostgreSQL, Redis, Nginx, Docker.""",
-        tools=["bash_commands", "docker_client", "file_system", "monitoring", "git_commands", "browser"],
-        initial_tasks=[],
-        dependencies=["eng_manager_001"]
-    ),
-
-    # QA
-    AgentConfig(
-        id="qa_001",
-        name="Iris",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.QA_ENGINEER,
-        temperature=0.3,
-        browser_enabled=True,
-        system_prompt="""You are Iris, QA Engineer ensuring quality.
-
-Test everything:
-1. Unit tests (pytest): 90%+ coverage
-2. Integration tests: All API endpoints
-3. E2E tests (Playwright): Critical user flows
-4. Performance tests: Load testing with Locust
-5. Security tests: OWASP Top 10
-6. Accessibility: WCAG 2.1 AA
-
-Testing pyramid: 70% unit, 20% integration, 10% E2E
-
-Break things so users don't have to.""",
-        tools=["code_editor", "test_runner", "browser", "api_tester", "git_commands"],
-        initial_tasks=[],
-        dependencies=["eng_manager_001"]
-    ),
-
-    # Product team
-    AgentConfig(
-        id="pm_001",
-        name="Jordan",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.PRODUCT_MANAGER,
-        temperature=0.4,
-        browser_enabled=True,
-        system_prompt="""You are Jordan, Product Manager defining what we build.
-
-Maintain the 24-Mango roadmap:
-- Days 1-10: Core + 4 Mangoes (Data, EA, Sales, Support)
-- Days 11-20: 10 Mangoes (Marketing, Design, Content, etc)
-- Days 21-30: 10 Mangoes (Finance, Legal, HR, etc) + Polish
-
-For each Mango, write:
-1. User stories
-2. Acceptance criteria
-3. Success metrics
-4. Competitive analysis
-
-Ship value, not features.""",
-        tools=["code_editor", "browser", "analytics", "competitor_tracker", "git_commands"],
-        initial_tasks=[],
-        dependencies=[]
-    ),
-
-    AgentConfig(
-        id="designer_001",
-        name="Mira",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.PRODUCT_DESIGNER,
-        temperature=0.5,
-        browser_enabled=True,
-        system_prompt="""You are Mira, Product Designer crafting beautiful UIs.
-
-Design:
-1. Dashboard for Mango management
-2. Chat interface
-3. Role-specific Mango UIs (24 of them)
-4. Component library (design system)
-5. Marketing site
-
-Principles:
-- Simplicity: Remove until it breaks
-- Speed: Optimize perceived performance
-- Accessibility: WCAG 2.1 AA
-- Consistency: Design system
-
-Output: Code-based designs (React components) + Figma files.""",
-        tools=["code_editor", "browser", "design_generator", "git_commands"],
-        initial_tasks=[],
-        dependencies=["pm_001"]
-    ),
-
-    AgentConfig(
-        id="writer_001",
-        name="Phoenix",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.TECHNICAL_WRITER,
-        temperature=0.4,
-        browser_enabled=True,
-        system_prompt="""You are Phoenix, Technical Writer documenting everything.
-
-Write:
-1. API documentation (OpenAPI spec)
-2. User guides for each Mango
-3. Onboarding tutorials
-4. Changelog
-5. Help center articles
-6. Internal developer docs
-
-Keep docs up-to-date with code. Ship docs with features.""",
-        tools=["code_editor", "browser", "api_spec_generator", "git_commands"],
-        initial_tasks=[],
-        dependencies=["pm_001"]
-    ),
-
-    # Business team
-    AgentConfig(
-        id="gtm_001",
-        name="Blaze",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.GTM_LEAD,
-        temperature=0.6,
-        browser_enabled=True,
-        system_prompt="""You are Blaze, Go-to-Market Lead driving customer acquisition.
-
-Build waitlist:
-1. Landing page with compelling copy
-2. Blog posts (SEO)
-3. Social media presence (Twitter, LinkedIn)
-4. Email drip campaigns
-5. Product Hunt launch materials
-6. Beta customer outreach
-
-Goal: 500 signups in 30 days, 100 paying customers in 60.""",
-        tools=["browser", "email_sender", "social_media", "analytics", "git_commands"],
-        initial_tasks=[],
-        dependencies=["pm_001"]
-    ),
-
-    AgentConfig(
-        id="cs_001",
-        name="Haven",
-        type=AgentType.DEVELOPER,
-        role=AgentRole.CUSTOMER_SUCCESS,
-        temperature=0.5,
-        browser_enabled=True,
-        system_prompt="""You are Haven, Customer Success Manager ensuring customers succeed.
-
-Support beta customers:
-1. Onboarding calls
-2. Weekly check-ins
-3. Feedback collection
-4. Bug escalation
-5. Feature requests
-6. Success stories
-
-Turn customers into advocates.""",
-        tools=["browser", "email_sender", "crm_client", "support_tickets", "git_commands"],
-        initial_tasks=[],
-        dependencies=["gtm_001"]
-    ),
-]
-
-# ============================================
-# MANGO AGENTS (Customer-facing products)
-# ============================================
-
-MANGO_AGENTS = [
-    AgentConfig(
-        id="mango_data_001",
-        name="Mango Data Entry",
-        type=AgentType.MANGO,
-        role=AgentRole.DATA_ENTRY,
-        temperature=0.1,
-        browser_enabled=True,
-        active=False,  # Will be activated after testing by developers
-        system_prompt="""You are Mango Data Entry, the most accurate data entry clerk in the world.
-
-YOUR CAPABILITIES:
-- Extract data from any format (PDF, image, email, CSV, Excel, web forms)
-- Enter data into any system (databases, CRMs, spreadsheets, web forms)
-- Validate data accuracy (99.9%+ accuracy rate)
-- Detect duplicates
-- Clean and normalize data
-
-YOUR WORKFLOW:
-1. Receive data source (file upload, email, screenshot)
-2. Extract data using OCR + AI parsing
-3. Validate and clean data
-4. Enter into target system
-5. Verify entry accuracy
-6. Report completion
-
-TOOLS YOU USE:
-- Browser (Puppeteer) for web form filling
-- OCR for document scanning
-- Database clients for direct entry
-- API integrations when available
-
-QUALITY STANDARDS:
-- 99.9%+ accuracy (1 error per 1000 entries)
-- 20x faster than human data entry
-- Zero data loss
-- Audit trail for every change
-
-REMEMBER: Accuracy > Speed. Double-check everything.""",
-        tools=["browser", "ocr", "database_client", "file_parser", "api_integrations"],
-        initial_tasks=[
-            {
-                "title": "Process test dataset",
-                "description": "100 customer records from CSV to PostgreSQL"
-            }
-        ],
-        dependencies=["backend_001", "backend_002"]
-    ),
-
-    AgentConfig(
-        id="mango_ea_001",
-        name="Mango EA",
-        type=AgentType.MANGO,
-        role=AgentRole.EXECUTIVE_ASSISTANT,
-        temperature=0.3,
-        browser_enabled=True,
-        active=False,  # Will be activated after testing by developers
-        system_prompt="""You are Mango EA, an executive assistant who never sleeps.
-
-YOUR CAPABILITIES:
-- Email management (read, triage, draft, send)
-- Calendar management (schedule, reschedule, find time)
-- Meeting coordination (book, send agendas, take notes)
-- Travel booking (flights, hotels, ground transport)
-- Expense tracking
-- Task management
-- Research and briefings
-
-YOUR WORKFLOW:
-1. Monitor inbox continuously
-2. Triage emails by priority (urgent/important matrix)
-3. Draft responses for routine emails (80% auto-send, 20% needs approval)
-4. Schedule meetings (check calendars, find optimal times, send invites)
-5. Prepare meeting materials (agenda, briefing doc, previous notes)
-6. Follow up on action items
-
-AUTONOMY LEVELS:
-- AUTO: Routine scheduling, email triage, expense logging
-- APPROVE: Important emails, external meetings, travel over $500
-- ESCALATE: Urgent issues, conflicts, sensitive matters
-
-COMMUNICATION STYLE:
-- Professional but warm
-- Concise and clear
-- Proactive (anticipate needs)
-- Always CC yourself for records
-
-REMEMBER: You work for your human. Learn their preferences, anticipate their needs, make their life easier.""",
-        tools=["browser", "gmail_api", "calendar_api", "telegram_api", "travel_apis", "expense_api"],
-        initial_tasks=[
-            {
-                "title": "Process test inbox",
-                "description": "Triage 50 emails and draft 10 responses"
-            }
-        ],
-        dependencies=["backend_001", "backend_002"]
-    ),
-
-    AgentConfig(
-        id="mango_sales_001",
-        name="Mango Sales",
-        type=AgentType.MANGO,
-        role=AgentRole.SALES_REP,
-        temperature=0.4,
-        browser_enabled=True,
-        system_prompt="""You are Mango Sales, a top-performing sales rep who works 24/7.
-
-YOUR CAPABILITIES:
-- Prospect research (LinkedIn, company websites, news)
-- Personalized outbound emails (30%+ open rate, 10%+ meeting rate)
-- LinkedIn outreach automation
-- Meeting booking and qualification
-- CRM management (Salesforce, HubSpot)
-- Follow-up sequences (7+ touchpoints)
-- Objection handling
-- Deal pipeline management
-
-YOUR SALES PROCESS:
-1. RESEARCH: Find ideal prospects (ICP match)
-2. PERSONALIZE: Write custom emails (no templates)
-3. OUTREACH: Email + LinkedIn message
-4. FOLLOW-UP: 7 touchpoints over 3 weeks
-5. QUALIFY: BANT (Budget, Authority, Need, Timeline)
-6. BOOK: Schedule demo with AE
-7. CRM: Log everything
-
-YOUR METRICS:
-- 100 emails/day (personalized, not spam)
-- 30%+ open rate
-- 10%+ meeting booking rate
-- 5x ROI on sales tools
-
-REMEMBER: Personalization wins. Research first, reach out second. Always provide value.""",
-        tools=["browser", "linkedin_api", "gmail_api", "crm_api", "prospect_tools", "calendar_api"],
-        initial_tasks=[
-            {
-                "title": "Generate 50 qualified prospects",
-                "description": "SaaS companies, 50-200 employees, Series A+"
-            },
-            {
-                "title": "Send 10 personalized outbound emails",
-                "description": "Research + custom message for each"
-            }
-        ],
-        dependencies=["backend_001", "backend_002"]
-    ),
-
-    AgentConfig(
-        id="mango_support_001",
-        name="Mango Customer Support",
-        type=AgentType.MANGO,
-        role=AgentRole.CUSTOMER_SUPPORT,
-        temperature=0.4,
-        browser_enabled=True,
-        system_prompt="""You are Mango Customer Support, providing 24/7 customer service.
-
-Handle: Email, chat, tickets. Response time <2 min. Resolution rate 90%+. CSAT 4.8+/5.
-
-Use browser to access support systems. Search knowledge base. Escalate complex issues.""",
-        tools=["browser", "email_api", "chat_api", "ticket_system", "knowledge_base"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_marketing_001",
-        name="Mango Marketing Manager",
-        type=AgentType.MANGO,
-        role=AgentRole.MARKETING_MANAGER,
-        temperature=0.6,
-        browser_enabled=True,
-        system_prompt="""Marketing Manager: Plan campaigns, create content, manage SEO, social media, email marketing. Drive traffic and leads.""",
-        tools=["browser", "seo_tools", "social_media_apis", "email_marketing", "analytics"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_design_001",
-        name="Mango Graphic Designer",
-        type=AgentType.MANGO,
-        role=AgentRole.GRAPHIC_DESIGNER,
-        temperature=0.7,
-        browser_enabled=True,
-        system_prompt="""Graphic Designer: Create branded graphics for social, ads, presentations. Use Figma, Canva, DALL-E. Maintain brand consistency.""",
-        tools=["browser", "figma_api", "canva_api", "dalle", "brand_assets"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_recruit_001",
-        name="Mango Recruiter",
-        type=AgentType.MANGO,
-        role=AgentRole.RECRUITER,
-        temperature=0.4,
-        browser_enabled=True,
-        system_prompt="""Recruiter: Source candidates (LinkedIn, Indeed), screen resumes, schedule interviews, manage ATS, candidate communication.""",
-        tools=["browser", "linkedin_api", "indeed_api", "ats_api", "email_api"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_finance_001",
-        name="Mango IB Analyst",
-        type=AgentType.MANGO,
-        role=AgentRole.IB_ANALYST,
-        temperature=0.2,
-        browser_enabled=True,
-        system_prompt="""IB Analyst: Financial modeling (DCF, comps), market research, pitch decks, valuations. Excel wizard.""",
-        tools=["browser", "excel_api", "financial_data_apis", "powerpoint_api"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_cfo_001",
-        name="Mango CFO",
-        type=AgentType.MANGO,
-        role=AgentRole.CFO,
-        temperature=0.2,
-        browser_enabled=True,
-        system_prompt="""CFO: Cash flow forecasting, budget management, financial reporting, board decks, fundraising support.""",
-        tools=["browser", "accounting_apis", "excel_api", "database_client"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_content_001",
-        name="Mango Content Writer",
-        type=AgentType.MANGO,
-        role=AgentRole.CONTENT_WRITER,
-        temperature=0.7,
-        browser_enabled=True,
-        system_prompt="""Content Writer: Blog posts, articles, whitepapers, case studies, SEO-optimized content. 2000+ words/hour.""",
-        tools=["browser", "cms_api", "seo_tools", "plagiarism_checker"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_legal_001",
-        name="Mango Legal Assistant",
-        type=AgentType.MANGO,
-        role=AgentRole.LEGAL_ASSISTANT,
-        temperature=0.2,
-        browser_enabled=True,
-        system_prompt="""Legal Assistant: Contract review, legal research, compliance checks, NDA drafting. Not a lawyer - assists lawyers.""",
-        tools=["browser", "document_parser", "legal_databases"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_accountant_001",
-        name="Mango Accountant",
-        type=AgentType.MANGO,
-        role=AgentRole.ACCOUNTANT,
-        temperature=0.1,
-        browser_enabled=True,
-        system_prompt="""Accountant: Bookkeeping, reconciliation, invoicing, tax prep assistance, financial statements.""",
-        tools=["browser", "quickbooks_api", "xero_api", "excel_api"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_pm_001",
-        name="Mango Project Manager",
-        type=AgentType.MANGO,
-        role=AgentRole.PROJECT_MANAGER,
-        temperature=0.4,
-        browser_enabled=True,
-        system_prompt="""Project Manager: Plan projects, track tasks, manage timelines, coordinate teams, status reports.""",
-        tools=["browser", "jira_api", "asana_api", "telegram_api"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_hr_001",
-        name="Mango HR Manager",
-        type=AgentType.MANGO,
-        role=AgentRole.HR_MANAGER,
-        temperature=0.4,
-        browser_enabled=True,
-        system_prompt="""HR Manager: Onboarding, benefits admin, policy questions, employee records, performance review coordination.""",
-        tools=["browser", "hris_api", "email_api", "document_generator"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_ops_001",
-        name="Mango Operations Manager",
-        type=AgentType.MANGO,
-        role=AgentRole.OPERATIONS_MANAGER,
-        temperature=0.3,
-        browser_enabled=True,
-        system_prompt="""Operations Manager: Process optimization, vendor management, inventory, logistics, operational efficiency.""",
-        tools=["browser", "erp_api", "spreadsheet_api", "workflow_automation"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_analyst_001",
-        name="Mango Business Analyst",
-        type=AgentType.MANGO,
-        role=AgentRole.BUSINESS_ANALYST,
-        temperature=0.3,
-        browser_enabled=True,
-        system_prompt="""Business Analyst: Data analysis, reporting, dashboards, business intelligence, insights and recommendations.""",
-        tools=["browser", "database_client", "bi_tools", "excel_api"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_social_001",
-        name="Mango Social Media Manager",
-        type=AgentType.MANGO,
-        role=AgentRole.SOCIAL_MEDIA_MANAGER,
-        temperature=0.7,
-        browser_enabled=True,
-        system_prompt="""Social Media Manager: Content calendar, post scheduling, engagement, analytics, community management.""",
-        tools=["browser", "twitter_api", "linkedin_api", "instagram_api", "scheduling_tools"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_copy_001",
-        name="Mango Copywriter",
-        type=AgentType.MANGO,
-        role=AgentRole.COPYWRITER,
-        temperature=0.8,
-        browser_enabled=True,
-        system_prompt="""Copywriter: Ad copy, landing pages, email campaigns, product descriptions. Conversion-focused writing.""",
-        tools=["browser", "ab_testing_tools", "cms_api"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_video_001",
-        name="Mango Video Editor",
-        type=AgentType.MANGO,
-        role=AgentRole.VIDEO_EDITOR,
-        temperature=0.6,
-        browser_enabled=True,
-        system_prompt="""Video Editor: Edit videos using AI tools (Runway, Descript), create shorts, add captions, thumbnails.""",
-        tools=["browser", "video_editing_apis", "thumbnail_generator"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_research_001",
-        name="Mango Researcher",
-        type=AgentType.MANGO,
-        role=AgentRole.RESEARCHER,
-        temperature=0.3,
-        browser_enabled=True,
-        system_prompt="""Researcher: Deep research on any topic, competitive intelligence, market analysis, report generation.""",
-        tools=["browser", "web_scraper", "database_access", "academic_apis"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_translator_001",
-        name="Mango Translator",
-        type=AgentType.MANGO,
-        role=AgentRole.TRANSLATOR,
-        temperature=0.2,
-        browser_enabled=False,
-        system_prompt="""Translator: Translate documents, websites, conversations. 100+ languages. Maintain tone and context.""",
-        tools=["translation_api", "document_parser", "website_translator"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_transcribe_001",
-        name="Mango Transcriptionist",
-        type=AgentType.MANGO,
-        role=AgentRole.TRANSCRIPTIONIST,
-        temperature=0.1,
-        browser_enabled=False,
-        system_prompt="""Transcriptionist: Transcribe audio/video, add timestamps, speaker labels, clean up filler words.""",
-        tools=["audio_transcription_api", "video_transcription_api"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_receptionist_001",
-        name="Mango Virtual Receptionist",
-        type=AgentType.MANGO,
-        role=AgentRole.VIRTUAL_RECEPTIONIST,
-        temperature=0.4,
-        browser_enabled=True,
-        system_prompt="""Virtual Receptionist: Answer calls, greet visitors, transfer calls, take messages, schedule appointments.""",
-        tools=["browser", "phone_api", "calendar_api", "crm_api"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-
-    AgentConfig(
-        id="mango_booking_001",
-        name="Mango Booking Coordinator",
-        type=AgentType.MANGO,
-        role=AgentRole.BOOKING_COORDINATOR,
-        temperature=0.3,
-        browser_enabled=True,
-        system_prompt="""Booking Coordinator: Handle reservations, bookings, appointments. Optimize scheduling and capacity.""",
-        tools=["browser", "booking_system_api", "calendar_api", "payment_api"],
-        initial_tasks=[],
-        dependencies=["backend_001"]
-    ),
-]
-
-# Combine all agents
-ALL_AGENTS = DEVELOPER_AGENTS + MANGO_AGENTS
+def __getattr__(name: str):
+    """Build the agent lists and lookup tables on first access"""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _LAZY_ATTRS[name]()
+    globals()[name] = value
+    return value
 
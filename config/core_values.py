@@ -5,6 +5,9 @@ These values define who we are, how we work, and what we stand for.
 Every agent MUST embody these traits in every interaction.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 CORE_CHARACTER_TRAITS = """
 ═══════════════════════════════════════════════════════════════════
 🎯 CORE CHARACTER TRAITS - The Foundation of Our Team
@@ -121,7 +124,16 @@ A world-class engineering org feels like a jazz band, not a marching band.
 ═══════════════════════════════════════════════════════════════════
 """
 
-ROLE_SPECIFIC_TRAITS = {
+# The values every agent shares, joined once; role prompts build on this one string
+SHARED_VALUES_PROMPT = f"""
+{CORE_CHARACTER_TRAITS}
+
+{TEAM_HABITS}
+
+{EMOTIONAL_CULTURE}
+"""
+
+ROLE_SPECIFIC_TRAITS = MappingProxyType({
     "engineers": """
 ENGINEERS (Individual Contributors)
   • Curious, methodical thinkers
@@ -170,90 +182,86 @@ SRE / PLATFORM ENGINEER
   • Calm under pressure during incidents
   • Root cause > symptom patching
     """
-}
+})
 
-COMMUNICATION_EXAMPLES = {
-    "intellectual_honesty": [
+COMMUNICATION_EXAMPLES = MappingProxyType({
+    "intellectual_honesty": (
         "✅ 'I don't know the answer, but I'll research and get back to you in 30 min'",
         "✅ 'The tests show our assumption was wrong. Let's pivot.'",
         "✅ 'What's the evidence for this approach?'",
         "❌ 'Trust me, this will work' (without data)",
         "❌ 'Probably fine' (when uncertain)"
-    ],
+    ),
     
-    "calm_thinking": [
+    "calm_thinking": (
         "✅ 'Production is down. Let me check metrics first, then act.'",
         "✅ 'Pause. Let's look at the logs before rolling back.'",
         "✅ 'Here's my thought process documented for the team.'",
         "❌ 'QUICK! JUST RESTART EVERYTHING!'",
         "❌ 'I think it's X... maybe Y... or Z?'"
-    ],
+    ),
     
-    "small_ego": [
+    "small_ego": (
         "✅ 'You're right, that approach is cleaner. Let's use yours.'",
         "✅ 'Good catch in code review! Fixed.'",
         "✅ 'I was wrong about the architecture. Let's redesign.'",
         "❌ 'But I spent 3 days on this!' (defending bad code)",
         "❌ 'My way is better because I'm senior.'"
-    ],
+    ),
     
-    "feedback": [
+    "feedback": (
         "✅ 'I think there's a simpler version of this. Want to explore?'",
         "✅ 'The logic works, but could we extract this into a function?'",
         "✅ 'Great solution! One suggestion: add error handling here.'",
         "❌ 'This code is terrible.'",
         "❌ 'You always overcomplicate things.'"
-    ],
+    ),
     
-    "ownership": [
+    "ownership": (
         "✅ 'That bug is in my area. I'll fix it today.'",
         "✅ 'Production impact: 200 users affected. Here's my plan.'",
         "✅ 'Not my code, but I'll own the investigation.'",
         "❌ 'Not my problem, ask the other team.'",
         "❌ 'I just write code, ops handles production.'"
-    ]
+    )
+})
+
+# Which ROLE_SPECIFIC_TRAITS entry each agent role gets (anything else: "engineers")
+_ROLE_TRAITS_KEY = {
+    "engineering_manager": "engineering_manager",
+    "backend_engineer": "engineers",
+    "frontend_engineer": "engineers",
+    "ml_engineer": "tech_lead",
+    "devops_engineer": "sre",
+    "qa_engineer": "engineers",
+    "product_manager": "product_manager",
+    "product_designer": "designer",
+    "technical_writer": "engineers"
 }
 
+@lru_cache(maxsize=None)
+def _character_prompt(traits_key: str) -> str:
+    """Full character prompt for a ROLE_SPECIFIC_TRAITS key, built on first use"""
+    # Built lazily: with emoji in the text each prompt is ~16 KB in memory,
+    # and a worker usually runs only one or two roles
+    return f"{SHARED_VALUES_PROMPT}\n{ROLE_SPECIFIC_TRAITS[traits_key]}\n"
+
 def get_character_prompt_for_role(role: str) -> str:
     """Get character traits formatted for an agent's system prompt"""
-    
-    base_values = f"""
-{CORE_CHARACTER_TRAITS}
-
-{TEAM_HABITS}
-
-{EMOTIONAL_CULTURE}
-"""
-    
-    # Add role-specific traits
-    role_key = {
-        "engineering_manager": "engineering_manager",
-        "backend_engineer": "engineers",
-        "frontend_engineer": "engineers",
-        "ml_engineer": "tech_lead",
-        "devops_engineer": "sre",
-        "qa_engineer": "engineers",
-        "product_manager": "product_manager",
-        "product_designer": "designer",
-        "technical_writer": "engineers"
-    }.get(role, "engineers")
-    
-    if role_key in ROLE_SPECIFIC_TRAITS:
-        base_values += f"\n{ROLE_SPECIFIC_TRAITS[role_key]}\n"
-    
-    return base_values
+    return _character_prompt(_ROLE_TRAITS_KEY.get(role, "engineers"))
 
+@lru_cache(maxsize=1)
 def get_communication_examples() -> str:
-    """Get communication examples showing values in action"""
-    examples = "\n═══════════════════════════════════════════════════════════════════\n"
-    examples += "📣 COMMUNICATION EXAMPLES - Values in Action\n"
-    examples += "═══════════════════════════════════════════════════════════════════\n\n"
+    """Get communication examples showing values in action (built once, then cached)"""
+    parts = [
+        "\n═══════════════════════════════════════════════════════════════════\n",
+        "📣 COMMUNICATION EXAMPLES - Values in Action\n",
+        "═══════════════════════════════════════════════════════════════════\n\n",
+    ]
     
     for trait, examples_list in COMMUNICATION_EXAMPLES.items():
-        examples += f"{trait.upper().replace('_', ' ')}:\n"
-        for example in examples_list:
-            examples += f"  {example}\n"
-        examples += "\n"
+        parts.append(f"{trait.upper().replace('_', ' ')}:\n")
+        parts.extend(f"  {example}\n" for example in examples_list)
+        parts.append("\n")
     
-    return examples
-
+    return "".join(parts)
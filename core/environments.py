@@ -3,16 +3,73 @@ Environment Management - TEST vs PRODUCTION separation
 Strict deployment gates ensure zero bugs reach production
 """
 
+import asyncio
+import copy
+import itertools
 import json
 import logging
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from collections import deque
+from dataclasses import dataclass
 from enum import Enum
 
 logger = logging.getLogger('Environments')
 
+# State and deployment files are machine-read; set PRETTY_JSON=1 to indent them for debugging
+_JSON_FORMAT = {'indent': 2} if os.getenv('PRETTY_JSON') else {'separators': (',', ':')}
+
+def _read_json(path: Path):
+    """Read a JSON file (call through asyncio.to_thread from async code)"""
+    with open(path) as f:
+        return json.load(f)
+
+def _write_json(path: Path, data) -> None:
+    """Write a JSON file atomically (call through asyncio.to_thread from async code)"""
+    _replace_file(path, json.dumps(data, **_JSON_FORMAT))
+
+def _replace_file(path: Path, text: str) -> None:
+    """Write text to a temp file next to path, then swap it in (call through asyncio.to_thread)"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _create_exclusive(path: Path) -> bool:
+    """Create an empty file, False if it already exists (call through asyncio.to_thread)"""
+    try:
+        with open(path, 'x'):
+            return True
+    except FileExistsError:
+        return False
+
+def _release_claim(path: Path) -> None:
+    """Remove a file claimed by _create_exclusive that was never written"""
+    try:
+        if path.stat().st_size == 0:
+            path.unlink()
+    except FileNotFoundError:
+        pass
+
+def _append_json_line(path: Path, record: Dict) -> None:
+    """Append one record to a JSONL file (call through asyncio.to_thread from async code)"""
+    with open(path, 'a') as f:
+        f.write(json.dumps(record, separators=(',', ':')) + "\n")
+
+def _read_json_tail(path: Path, count: int) -> List[Dict]:
+    """Last count records of a JSONL file (call through asyncio.to_thread from async code)"""
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in deque(f, maxlen=count)]
+
 class Environment(Enum):
     TEST = "test"
     STAGING = "staging"
@@ -26,7 +83,7 @@ class DeploymentStatus(Enum):
     FAILED = "failed"
     ROLLED_BACK = "rolled_back"
 
-@dataclass
+@dataclass(slots=True)
 class DeploymentGate:
     """Requirements that must pass before TEST → PRODUCTION"""
     test_coverage_min: float = 90.0  # Minimum 90% test coverage
@@ -40,7 +97,7 @@ class DeploymentGate:
     load_test_pass: bool = True  # Handle expected load
     documentation_complete: bool = True  # All docs written
 
-@dataclass
+@dataclass(slots=True)
 class DeploymentRequest:
     """Request to deploy from TEST → PRODUCTION"""
     id: str
@@ -57,18 +114,115 @@ class DeploymentRequest:
     blockers: List[str]
     rollback_plan: str
 
+    def to_dict(self) -> Dict:
+        """JSON-ready dict (enums stored by value)"""
+        return {
+            'id': self.id,
+            'requested_by': self.requested_by,
+            'component': self.component,
+            'version': self.version,
+            'environment_from': self.environment_from.value,
+            'environment_to': self.environment_to.value,
+            'timestamp': self.timestamp,
+            'status': self.status.value,
+            'test_results': dict(self.test_results),
+            'code_review_status': self.code_review_status,
+            'approvals': list(self.approvals),
+            'blockers': list(self.blockers),
+            'rollback_plan': self.rollback_plan
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DeploymentRequest":
+        """Inverse of to_dict; extra keys (e.g. rejection_reason) are ignored"""
+        return cls(
+            id=data['id'],
+            requested_by=data['requested_by'],
+            component=data['component'],
+            version=data['version'],
+            environment_from=Environment(data['environment_from']),
+            environment_to=Environment(data['environment_to']),
+            timestamp=data['timestamp'],
+            status=DeploymentStatus(data['status']),
+            test_results=data['test_results'],
+            code_review_status=data['code_review_status'],
+            approvals=list(data['approvals']),
+            blockers=list(data['blockers']),
+            rollback_plan=data['rollback_plan']
+        )
+
+# (current status, action) -> new status; pairs not listed are refused
+_TRANSITIONS = {
+    (DeploymentStatus.APPROVED, 'deploy'): DeploymentStatus.DEPLOYED,
+    (DeploymentStatus.PENDING, 'reject'): DeploymentStatus.FAILED,
+    (DeploymentStatus.TESTING, 'reject'): DeploymentStatus.FAILED,
+    (DeploymentStatus.APPROVED, 'reject'): DeploymentStatus.FAILED,
+}
+
+# Any one of these approvals releases a deployment to production
+_DEPLOY_APPROVERS = frozenset({"eng_manager_001", "human"})
+
+def _critical_vulns(vulnerabilities: List[Dict]) -> int:
+    """Number of critical/high findings in a security scan"""
+    return sum(1 for v in vulnerabilities if v.get('severity') in ('critical', 'high'))
+
+# Deployment gates, in report order:
+# (DeploymentGate flag or None for always, value(request, test_results), blocks(value, gates), message(value, gates))
+_GATES = (
+    (None,
+     lambda request, results: results.get('coverage', 0.0),
+     lambda coverage, gates: coverage < gates.test_coverage_min,
+     lambda coverage, gates: f"Test coverage {coverage}% < required {gates.test_coverage_min}%"),
+    ('tests_must_pass',
+     lambda request, results: results.get('tests_failed', 0),
+     lambda failed, gates: failed > 0,
+     lambda failed, gates: f"{failed} tests failed"),
+    ('code_review_required',
+     lambda request, results: request.code_review_status,
+     lambda review, gates: review != "approved",
+     lambda review, gates: "Code review not approved"),
+    ('security_scan_required',
+     lambda request, results: _critical_vulns(results.get('vulnerabilities', [])),
+     lambda critical, gates: critical > 0,
+     lambda critical, gates: f"{critical} critical/high vulnerabilities found"),
+    ('zero_critical_bugs',
+     lambda request, results: results.get('critical_bugs', 0),
+     lambda bugs, gates: bugs > 0,
+     lambda bugs, gates: f"{bugs} critical bugs found"),
+    ('integration_tests_pass',
+     lambda request, results: results.get('integration_tests_passed', False),
+     lambda passed, gates: not passed,
+     lambda passed, gates: "Integration tests failed"),
+    ('performance_benchmark',
+     lambda request, results: results.get('performance_benchmark_passed', False),
+     lambda passed, gates: not passed,
+     lambda passed, gates: "Performance benchmark not met"),
+    ('documentation_complete',
+     lambda request, results: results.get('documentation_complete', False),
+     lambda complete, gates: not complete,
+     lambda complete, gates: "Documentation incomplete"),
+)
+
 class EnvironmentManager:
     """Manages TEST and PRODUCTION environments with strict gates"""
     
+    STATE_FLUSH_DELAY = 0.1  # Seconds; a burst of deploys shares one state.json write
+    
     def __init__(self, data_dir: Path):
         self.data_dir = data_dir
         self.test_dir = data_dir / "environments" / "test"
         self.staging_dir = data_dir / "environments" / "staging"
         self.prod_dir = data_dir / "environments" / "production"
         self.deployments_dir = data_dir / "deployments"
+        self.components_dir = data_dir / "components"  # <component>.jsonl production deploy logs
+        self._env_dirs = {
+            Environment.TEST: self.test_dir,
+            Environment.STAGING: self.staging_dir,
+            Environment.PRODUCTION: self.prod_dir
+        }
         
         # Create directories
-        for dir_path in [self.test_dir, self.staging_dir, self.prod_dir, self.deployments_dir]:
+        for dir_path in [self.test_dir, self.staging_dir, self.prod_dir, self.deployments_dir, self.components_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
         
         # Deployment gates
@@ -78,6 +232,30 @@ class EnvironmentManager:
         self.current_environment = Environment.TEST  # Start in TEST
         self.test_state = self._load_environment_state(Environment.TEST)
         self.prod_state = self._load_environment_state(Environment.PRODUCTION)
+        self.staging_state = self._load_environment_state(Environment.STAGING)
+        
+        # Live state per environment; health checks read this instead of state.json
+        self._states = {
+            Environment.TEST: self.test_state,
+            Environment.STAGING: self.staging_state,
+            Environment.PRODUCTION: self.prod_state
+        }
+        
+        # State changes waiting for the next flush
+        self._dirty: Dict[Environment, Dict] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()  # One flush at a time
+        
+        # Deployment requests by id, filled on first read and written through
+        self._deployments: Dict[str, Dict] = {}
+        
+        # deployment_id -> status, so listings don't open every request file
+        # (kept outside deployments_dir so it can never be loaded as a request)
+        self.index_file = data_dir / "deployment_index.json"
+        self._status_index = self._load_status_index()
+        self._index_lock = asyncio.Lock()  # Index snapshots land in order
+        self._seq = itertools.count(self._load_max_seq() + 1)
         
         logger.info("🏗️ Environment manager initialized")
         logger.info(f"📍 Current environment: {self.current_environment.value}")
@@ -99,19 +277,123 @@ class EnvironmentManager:
         }
     
     def _save_environment_state(self, env: Environment, state: Dict):
-        """Save environment state"""
-        state_file = self._get_env_dir(env) / "state.json"
-        with open(state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        """Mark environment state for saving; it's written on the next flush"""
+        self._dirty[env] = state
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.STATE_FLUSH_DELAY, self._start_flush
+            )
+    
+    def _start_flush(self):
+        """Timer callback for the delayed flush"""
+        self._flush_handle = None
+        self._flush_task = asyncio.create_task(self._timed_flush())
+    
+    async def _timed_flush(self):
+        """Delayed flush; a failed write stays pending for the next flush"""
+        try:
+            await self.force_flush()
+        except Exception as e:
+            logger.error(f"❌ Failed to save environment state: {e}")
+    
+    async def force_flush(self):
+        """Write all pending environment state now (waits for a flush already in progress)"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        async with self._flush_lock:
+            while self._dirty:
+                env, state = self._dirty.popitem()
+                # Encode here so later mutations can't race the writer thread
+                payload = json.dumps(state, **_JSON_FORMAT)
+                state_file = self._get_env_dir(env) / "state.json"
+                try:
+                    await asyncio.to_thread(_replace_file, state_file, payload)
+                except Exception:
+                    self._dirty.setdefault(env, state)
+                    raise
+    
+    def _load_status_index(self) -> Dict[str, str]:
+        """Load the deployment status index, adding request files it doesn't list
+        (all of them when the index is missing or unreadable)"""
+        index = {}
+        if self.index_file.exists():
+            try:
+                index = _read_json(self.index_file)
+            except ValueError as e:
+                logger.warning(f"⚠️  Deployment index unreadable, rebuilding: {e}")
+            if not isinstance(index, dict):
+                logger.warning("⚠️  Deployment index malformed, rebuilding")
+                index = {}
+        
+        # Requests saved before a crash could write the index
+        missing = [p for p in self.deployments_dir.glob("deploy_*.json") if p.stem not in index]
+        for deploy_file in missing:
+            try:
+                data = _read_json(deploy_file)
+            except ValueError as e:
+                logger.warning(f"⚠️  Skipping unreadable {deploy_file.name}: {e}")
+                continue
+            index[data['id']] = data['status']
+        if missing:
+            _write_json(self.index_file, index)
+        return index
+    
+    async def _set_index_status(self, deployment_id: str, status: str):
+        """Record a status in the index and persist it"""
+        if self._status_index.get(deployment_id) == status:
+            return
+        self._status_index[deployment_id] = status
+        async with self._index_lock:
+            # Snapshot under the lock so the newest index is always written last
+            await asyncio.to_thread(_write_json, self.index_file, dict(self._status_index))
+    
+    def _load_max_seq(self) -> int:
+        """Highest deployment sequence number in the index (ids from before sequencing are skipped)"""
+        seqs = [
+            int(suffix) for suffix in (
+                deployment_id.rpartition('_')[2] for deployment_id in self._status_index
+            )
+            if len(suffix) == 10 and suffix.isdigit()
+        ]
+        return max(seqs, default=0)
+    
+    async def _reserve_deployment_id(self, component: str) -> str:
+        """Next free deployment id; creating its file claims it, even against other processes"""
+        while True:
+            deployment_id = f"deploy_{component}_{next(self._seq):010d}"
+            request_file = self.deployments_dir / f"{deployment_id}.json"
+            if await asyncio.to_thread(_create_exclusive, request_file):
+                return deployment_id
+    
+    async def _load_deployment(self, deployment_id: str) -> Optional[Dict]:
+        """Deployment request data from the cache, falling back to disk"""
+        # Only deploy_* names in deployments_dir are requests (ids come from chat commands)
+        if not deployment_id.startswith("deploy_") or Path(deployment_id).name != deployment_id:
+            return None
+        
+        data = self._deployments.get(deployment_id)
+        if data is None:
+            request_file = self.deployments_dir / f"{deployment_id}.json"
+            if not request_file.exists():
+                return None
+            data = await asyncio.to_thread(_read_json, request_file)
+            self._deployments[deployment_id] = data
+        return data
+    
+    async def _save_deployment(self, data: Dict):
+        """Write a deployment request through the cache to disk"""
+        self._deployments[data['id']] = data
+        request_file = self.deployments_dir / f"{data['id']}.json"
+        await asyncio.to_thread(_write_json, request_file, data)
+        
+        # Request file first: if the index write is lost, the file is still authoritative
+        await self._set_index_status(data['id'], data['status'])
     
     def _get_env_dir(self, env: Environment) -> Path:
         """Get directory for environment"""
-        if env == Environment.TEST:
-            return self.test_dir
-        elif env == Environment.STAGING:
-            return self.staging_dir
-        else:
-            return self.prod_dir
+        return self._env_dirs[env]
     
     async def get_current_environment(self) -> Environment:
         """Get current active environment"""
@@ -122,13 +404,14 @@ class EnvironmentManager:
         logger.info(f"🧪 Deploying {component} v{version} to TEST by {deployed_by}")
         
         # Update TEST state
+        now = datetime.now().isoformat()
         self.test_state["deployed_components"][component] = {
             "version": version,
             "deployed_by": deployed_by,
-            "deployed_at": datetime.now().isoformat(),
+            "deployed_at": now,
             "status": "active"
         }
-        self.test_state["last_deployment"] = datetime.now().isoformat()
+        self.test_state["last_deployment"] = now
         
         self._save_environment_state(Environment.TEST, self.test_state)
         
@@ -145,49 +428,54 @@ class EnvironmentManager:
     ) -> str:
         """Request deployment to PRODUCTION (requires passing all gates)"""
         
-        deployment_id = f"deploy_{component}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        request = DeploymentRequest(
-            id=deployment_id,
-            requested_by=requested_by,
-            component=component,
-            version=version,
-            environment_from=Environment.TEST,
-            environment_to=Environment.PRODUCTION,
-            timestamp=datetime.now().isoformat(),
-            status=DeploymentStatus.PENDING,
-            test_results=test_results,
-            code_review_status="pending",
-            approvals=[],
-            blockers=[],
-            rollback_plan=rollback_plan
-        )
-        
-        # Save deployment request
-        request_file = self.deployments_dir / f"{deployment_id}.json"
-        with open(request_file, 'w') as f:
-            json.dump(asdict(request), f, indent=2)
-        
-        logger.info(f"📋 Production deployment requested: {deployment_id}")
-        
-        # Check gates
-        blockers = await self._check_deployment_gates(request, test_results)
-        
-        if blockers:
-            request.status = DeploymentStatus.FAILED
-            request.blockers = blockers
+        now = datetime.now()
+        deployment_id = await self._reserve_deployment_id(component)
+        
+        try:
+            request = DeploymentRequest(
+                id=deployment_id,
+                requested_by=requested_by,
+                component=component,
+                version=version,
+                environment_from=Environment.TEST,
+                environment_to=Environment.PRODUCTION,
+                timestamp=now.isoformat(),
+                status=DeploymentStatus.PENDING,
+                test_results=test_results,
+                code_review_status="pending",
+                approvals=[],
+                blockers=[],
+                rollback_plan=rollback_plan
+            )
             
-            with open(request_file, 'w') as f:
-                json.dump(asdict(request), f, indent=2)
+            logger.info(f"📋 Production deployment requested: {deployment_id}")
             
+            # Check gates; the request is saved once, with its outcome
+            blockers = await self._check_deployment_gates(request, test_results)
+            
+            if blockers:
+                request.status = DeploymentStatus.FAILED
+                request.blockers = blockers
+            else:
+                # All gates passed, waiting for approval
+                request.status = DeploymentStatus.APPROVED
+            
+            await self._save_deployment(request.to_dict())
+        except BaseException:
+            _release_claim(self.deployments_dir / f"{deployment_id}.json")
+            raise
+        
+        if blockers:
             logger.error(f"❌ Deployment {deployment_id} blocked: {blockers}")
-            return deployment_id
+        else:
+            logger.info(f"✅ Deployment {deployment_id} approved, ready for production")
+        
+        return deployment_id
         
         # All gates passed, waiting for approval
         request.status = DeploymentStatus.APPROVED
         
-        with open(request_file, 'w') as f:
-            json.dump(asdict(request), f, indent=2)
+        await self._save_deployment(request.to_dict())
         
         logger.info(f"✅ Deployment {deployment_id} approved, ready for production")
         
@@ -195,72 +483,29 @@ class EnvironmentManager:
     
     async def _check_deployment_gates(self, request: DeploymentRequest, test_results: Dict) -> List[str]:
         """Check all deployment gates - return list of blockers"""
+        gates = self.gates
         blockers = []
         
-        # Gate 1: Test Coverage
-        coverage = test_results.get('coverage', 0.0)
-        if coverage < self.gates.test_coverage_min:
-            blockers.append(f"Test coverage {coverage}% < required {self.gates.test_coverage_min}%")
-        
-        # Gate 2: All Tests Pass
-        if self.gates.tests_must_pass:
-            tests_passed = test_results.get('tests_passed', 0)
-            tests_failed = test_results.get('tests_failed', 0)
-            if tests_failed > 0:
-                blockers.append(f"{tests_failed} tests failed")
-        
-        # Gate 3: Code Review
-        if self.gates.code_review_required:
-            if request.code_review_status != "approved":
-                blockers.append("Code review not approved")
-        
-        # Gate 4: Security Scan
-        if self.gates.security_scan_required:
-            vulnerabilities = test_results.get('vulnerabilities', [])
-            critical_vulns = [v for v in vulnerabilities if v.get('severity') in ['critical', 'high']]
-            if critical_vulns:
-                blockers.append(f"{len(critical_vulns)} critical/high vulnerabilities found")
-        
-        # Gate 5: Zero Critical Bugs
-        if self.gates.zero_critical_bugs:
-            critical_bugs = test_results.get('critical_bugs', 0)
-            if critical_bugs > 0:
-                blockers.append(f"{critical_bugs} critical bugs found")
-        
-        # Gate 6: Integration Tests
-        if self.gates.integration_tests_pass:
-            integration_passed = test_results.get('integration_tests_passed', False)
-            if not integration_passed:
-                blockers.append("Integration tests failed")
-        
-        # Gate 7: Performance Benchmark
-        if self.gates.performance_benchmark:
-            performance_ok = test_results.get('performance_benchmark_passed', False)
-            if not performance_ok:
-                blockers.append("Performance benchmark not met")
-        
-        # Gate 8: Documentation
-        if self.gates.documentation_complete:
-            docs_complete = test_results.get('documentation_complete', False)
-            if not docs_complete:
-                blockers.append("Documentation incomplete")
+        for flag, get_value, blocks, message in _GATES:
+            if flag is None or getattr(gates, flag):
+                value = get_value(request, test_results)
+                if blocks(value, gates):
+                    blockers.append(message(value, gates))
         
         return blockers
     
     async def approve_deployment(self, deployment_id: str, approver: str):
         """Approve a deployment (Marcus or human)"""
-        request_file = self.deployments_dir / f"{deployment_id}.json"
+        request_data = await self._load_deployment(deployment_id)
         
-        if not request_file.exists():
+        if request_data is None:
             logger.error(f"❌ Deployment {deployment_id} not found")
             return False
         
-        with open(request_file) as f:
-            request_data = json.load(f)
-        
-        request = DeploymentRequest(**request_data)
+        request = DeploymentRequest.from_dict(request_data)
+        next_status = _TRANSITIONS.get((request.status, 'deploy'))
         
-        if request.status != DeploymentStatus.APPROVED:
+        if next_status is None:
             logger.error(f"❌ Deployment {deployment_id} not in approved state")
             return False
         
@@ -269,36 +514,66 @@ class EnvironmentManager:
             request.approvals.append(approver)
         
         # Check if we have required approvals (need Marcus or human)
-        if "eng_manager_001" in request.approvals or "human" in request.approvals:
+        if not _DEPLOY_APPROVERS.isdisjoint(request.approvals):
             # Deploy to production
             await self._execute_production_deployment(request)
-            request.status = DeploymentStatus.DEPLOYED
+            request.status = next_status
             
             logger.info(f"🚀 {request.component} v{request.version} DEPLOYED TO PRODUCTION")
         
         # Save updated request
-        with open(request_file, 'w') as f:
-            json.dump(asdict(request), f, indent=2)
+        await self._save_deployment(request.to_dict())
+        await self.force_flush()
         
         return True
     
+    async def reject_deployment(self, deployment_id: str, reason: str) -> bool:
+        """Reject a deployment (marks it failed). False if it doesn't exist;
+        ValueError if its status can't be rejected (e.g. already deployed)"""
+        request_data = await self._load_deployment(deployment_id)
+        
+        if request_data is None:
+            logger.error(f"❌ Deployment {deployment_id} not found")
+            return False
+        
+        next_status = _TRANSITIONS.get((DeploymentStatus(request_data['status']), 'reject'))
+        if next_status is None:
+            raise ValueError(f"Deployment {deployment_id} is already {request_data['status']}, can't reject")
+        
+        await self._save_deployment({
+            **request_data,
+            'status': next_status.value,
+            'rejection_reason': reason
+        })
+        
+        logger.info(f"🚫 Deployment {deployment_id} rejected: {reason}")
+        return True
+    
     async def _execute_production_deployment(self, request: DeploymentRequest):
         """Actually deploy to production"""
         logger.info(f"🚀 Deploying {request.component} to PRODUCTION")
         
         # Update PRODUCTION state
+        now = datetime.now().isoformat()
         self.prod_state["deployed_components"][request.component] = {
             "version": request.version,
             "deployed_by": request.requested_by,
-            "deployed_at": datetime.now().isoformat(),
+            "deployed_at": now,
             "status": "active",
             "deployment_id": request.id
         }
-        self.prod_state["last_deployment"] = datetime.now().isoformat()
+        self.prod_state["last_deployment"] = now
         self.prod_state["version"] = request.version
         
         self._save_environment_state(Environment.PRODUCTION, self.prod_state)
         
+        # Per-component history for rollback
+        await asyncio.to_thread(
+            _append_json_line,
+            self.components_dir / f"{request.component}.jsonl",
+            {"version": request.version, "timestamp": request.timestamp, "deployment_id": request.id}
+        )
+        
         logger.info(f"✅ {request.component} v{request.version} live in PRODUCTION")
     
     async def rollback_production(self, component: str, reason: str, rolled_back_by: str):
@@ -309,20 +584,16 @@ class EnvironmentManager:
             logger.error(f"❌ Component {component} not in production")
             return False
         
-        # Get deployment history
-        deployment_history = []
-        for deploy_file in self.deployments_dir.glob(f"deploy_{component}_*.json"):
-            with open(deploy_file) as f:
-                deployment_history.append(json.load(f))
-        
-        # Sort by timestamp, get previous version
-        deployment_history.sort(key=lambda x: x['timestamp'], reverse=True)
+        # Last two production deployments of this component: previous, current
+        deployment_history = await asyncio.to_thread(
+            _read_json_tail, self.components_dir / f"{component}.jsonl", 2
+        )
         
         if len(deployment_history) < 2:
             logger.error(f"❌ No previous version to rollback to")
             return False
         
-        previous = deployment_history[1]
+        previous = deployment_history[0]
         
         # Rollback
         self.prod_state["deployed_components"][component] = {
@@ -334,13 +605,15 @@ class EnvironmentManager:
         }
         
         self._save_environment_state(Environment.PRODUCTION, self.prod_state)
+        await self.force_flush()
         
         logger.info(f"✅ Rolled back {component} to v{previous['version']}")
         return True
     
     async def get_environment_health(self, env: Environment) -> Dict:
-        """Get health status of environment"""
-        state = self._load_environment_state(env)
+        """Get health status of environment (an Environment or its value, e.g. 'test')"""
+        env = Environment(env)
+        state = self._states[env]
         
         health = {
             "environment": env.value,
@@ -359,24 +632,25 @@ class EnvironmentManager:
         return health
     
     async def get_deployment_status(self, deployment_id: str) -> Optional[Dict]:
-        """Get status of a deployment"""
-        request_file = self.deployments_dir / f"{deployment_id}.json"
-        
-        if request_file.exists():
-            with open(request_file) as f:
-                return json.load(f)
-        
-        return None
+        """Get status of a deployment (a copy; the cached request stays untouched)"""
+        data = await self._load_deployment(deployment_id)
+        return copy.deepcopy(data) if data is not None else None
     
     async def get_pending_deployments(self) -> List[Dict]:
         """Get all pending production deployments"""
         pending = []
         
-        for deploy_file in self.deployments_dir.glob("deploy_*.json"):
-            with open(deploy_file) as f:
-                data = json.load(f)
-                if data['status'] in ['pending', 'approved']:
-                    pending.append(data)
+        for deployment_id, status in list(self._status_index.items()):
+            if status in ('pending', 'approved'):
+                data = await self._load_deployment(deployment_id)
+                if data is None:
+                    continue
+                if data['status'] != status:
+                    # Index missed a status change (e.g. crash between the two writes)
+                    await self._set_index_status(deployment_id, data['status'])
+                    if data['status'] not in ('pending', 'approved'):
+                        continue
+                pending.append(copy.deepcopy(data))
         
         return pending
 
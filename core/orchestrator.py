@@ -4,10 +4,14 @@ Coordinates all 39 agents (15 developers + 24 Mangoes) continuously.
 """
 
 import asyncio
+import hashlib
 import json
 import os
 import logging
+import time
+from collections import deque
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional
 from pathlib import Path
 import aiohttp
@@ -27,8 +31,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger('Orchestrator')
 
+def _digest(text: str) -> str:
+    """Short blake2b hex digest, for cache keys"""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+# System prompts are a few KB and the same for every call an agent makes: hash each once
+_system_digest = lru_cache(maxsize=64)(_digest)
+
 class GeminiRateLimiter:
-    """Stay within FREE tier: 1500 req/day, 1M tokens/day"""
+    """Stay within FREE tier: 15 req/min, 1500 req/day, 1M tokens/day"""
     
     def __init__(self):
         self.requests_today = 0
@@ -36,6 +47,8 @@ class GeminiRateLimiter:
         self.last_reset = datetime.now().date()
         self.MAX_REQUESTS = 1400  # Buffer
         self.MAX_TOKENS = 900000  # Buffer
+        self.MAX_REQUESTS_PER_MINUTE = 14  # Buffer
+        self.recent_requests = deque()  # Send times (monotonic) within the last minute
         
     def reset_if_new_day(self):
         today = datetime.now().date()
@@ -56,6 +69,17 @@ class GeminiRateLimiter:
         logger.info(f"📊 Usage: {self.requests_today}/{self.MAX_REQUESTS} req, "
                    f"{self.tokens_today:,}/{self.MAX_TOKENS:,} tokens")
     
+    def acquire_minute_slot(self) -> float:
+        """Claim a request slot in the sliding minute window.
+        Returns 0 if claimed, else seconds to wait before trying again."""
+        now = time.monotonic()
+        while self.recent_requests and now - self.recent_requests[0] >= 60:
+            self.recent_requests.popleft()
+        if len(self.recent_requests) < self.MAX_REQUESTS_PER_MINUTE:
+            self.recent_requests.append(now)
+            return 0.0
+        return 60 - (now - self.recent_requests[0])
+    
     def seconds_until_reset(self) -> int:
         tomorrow = (datetime.now() + timedelta(days=1)).replace(
             hour=0, minute=0, second=0, microsecond=0
@@ -113,7 +137,21 @@ class GeminiClient:
         if not self.model:
             logger.error("❌ No working Gemini model found! Tasks will use fallback generation.")
         self.limiter = GeminiRateLimiter()
-        self.cache = {}  # Simple cache
+        # One client is shared by every agent, so this caps in-flight calls platform-wide
+        self.concurrency = asyncio.Semaphore(int(os.getenv('GEMINI_MAX_CONCURRENCY', '4')))
+        self.cache = {}  # In-process cache: key -> (expires_at, response)
+        self.CACHE_TTL = 3600
+        self.CACHE_MAX_TEMPERATURE = 0.3  # Higher-temperature agents are meant to vary
+        self.redis = None  # Shared cache that survives restarts, if REDIS_URL is set
+        redis_url = os.getenv('REDIS_URL')
+        if redis_url:
+            try:
+                import redis.asyncio as aioredis
+                self.redis = aioredis.from_url(redis_url, decode_responses=True)
+                logger.info("✅ Using Redis for the LLM response cache")
+            except Exception as e:
+                logger.warning(f"⚠️  Redis cache unavailable, using in-process cache only: {e}")
+        self.MAX_RETRIES = 4  # On 429/quota errors, backing off 30s, 60s, 120s, 240s
         
     async def generate(self, agent_id: str, system: str, prompt: str, 
                       temp: float = 0.7) -> str:
@@ -124,11 +162,14 @@ class GeminiClient:
             logger.warning(f"⚠️  No Gemini model available for {agent_id}, using fallback")
             return self._fallback_response(agent_id, prompt)
         
-        # Check cache
-        cache_key = f"{agent_id}:{hash(prompt)}"
-        if cache_key in self.cache:
-            logger.info(f"💾 Cache hit: {agent_id}")
-            return self.cache[cache_key]
+        # Check cache (only for near-deterministic agents)
+        cache_key = None
+        if temp <= self.CACHE_MAX_TEMPERATURE:
+            cache_key = f"llm:{agent_id}:{temp}:{_system_digest(system)}:{_digest(prompt)}"
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"💾 Cache hit: {agent_id}")
+                return cached
         
         # Wait if rate limited
         if not self.limiter.can_make_request():
@@ -137,36 +178,75 @@ class GeminiClient:
             await asyncio.sleep(wait)
         
         # Make request
-        try:
-            full_prompt = f"{system}\n\n{prompt}"
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=temp,
-                    max_output_tokens=4096,
-                )
-            )
-            
-            result = response.text
-            tokens = response.usage_metadata.total_token_count
-            self.limiter.record_usage(tokens)
-            
-            # Cache result
-            if len(self.cache) > 1000:
-                self.cache.pop(next(iter(self.cache)))
-            self.cache[cache_key] = result
-            
+        full_prompt = f"{system}\n\n{prompt}"
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                async with self.concurrency:
+                    while (wait := self.limiter.acquire_minute_slot()) > 0:
+                        await asyncio.sleep(wait)
+                    response = await asyncio.to_thread(
+                        self.model.generate_content,
+                        full_prompt,
+                        generation_config=genai.types.GenerationConfig(
+                            temperature=temp,
+                            max_output_tokens=4096,
+                        )
+                    )
+                
+                result = response.text
+                tokens = response.usage_metadata.total_token_count
+                self.limiter.record_usage(tokens)
+                
+                if cache_key:
+                    await self._cache_set(cache_key, result)
+                
+                return result
+                
+            except Exception as e:
+                logger.error(f"❌ Gemini error for {agent_id}: {e}")
+                if ("429" in str(e) or "quota" in str(e).lower()) and attempt < self.MAX_RETRIES:
+                    wait = 30 * 2 ** attempt
+                    logger.warning(f"⏸️  Quota hit for {agent_id}, retrying in {wait}s")
+                    await asyncio.sleep(wait)
+                    continue
+                break
+        
+        # Use fallback instead of raising
+        logger.warning(f"⚠️  Using fallback response for {agent_id}")
+        return self._fallback_response(agent_id, prompt)
+    
+    async def _cache_get(self, key: str) -> Optional[str]:
+        """Look up a cached response: in-process first, then Redis"""
+        entry = self.cache.get(key)
+        if entry:
+            if entry[0] > time.monotonic():
+                return entry[1]
+            del self.cache[key]
+        if self.redis:
+            try:
+                result = await self.redis.get(key)
+            except Exception as e:
+                logger.debug(f"Redis cache read failed: {e}")
+                return None
+            if result is not None:
+                self._cache_local(key, result)
             return result
-            
-        except Exception as e:
-            logger.error(f"❌ Gemini error for {agent_id}: {e}")
-            if "429" in str(e) or "quota" in str(e).lower():
-                await asyncio.sleep(60)
-                return await self.generate(agent_id, system, prompt, temp)
-            # Use fallback instead of raising
-            logger.warning(f"⚠️  Using fallback response for {agent_id}")
-            return self._fallback_response(agent_id, prompt)
+        return None
+    
+    async def _cache_set(self, key: str, result: str):
+        """Cache a response in-process and in Redis, for CACHE_TTL seconds"""
+        self._cache_local(key, result)
+        if self.redis:
+            try:
+                await self.redis.set(key, result, ex=self.CACHE_TTL)
+            except Exception as e:
+                logger.debug(f"Redis cache write failed: {e}")
+    
+    def _cache_local(self, key: str, result: str):
+        """Add a response to the in-process cache, evicting the oldest past 1000 entries"""
+        if len(self.cache) > 1000:
+            self.cache.pop(next(iter(self.cache)))
+        self.cache[key] = (time.monotonic() + self.CACHE_TTL, result)
     
     def _fallback_response(self, agent_id: str, prompt: str) -> str:
         """Generate fallback response when Gemini is unavailable"""
@@ -411,6 +491,7 @@ class Orchestrator:
         self.cycle_count = 0
         self.start_time = datetime.now()
         self.last_self_eval = datetime.now()  # Track last self-evaluation
+        self.last_workload = None  # (idle agent ids, tasks completed) when the Task Master last ran
         
         # WebSocket manager reference (will be set by main())
         self.ws_manager = None
@@ -1024,6 +1105,79 @@ Generate 15-25 strategic tasks NOW:"""
                     self.task_manager.create_task(task)
                 logger.info(f"✅ Created {len(fallback_tasks)} fallback tasks")
     
+    async def _task_master_cycle(self):
+        """Task Master (Atlas) gives idle agents work.
+        Only asks the LLM when the workload changed since its last run: a different set of
+        idle agents, or tasks completed since then. Otherwise the previous answer still holds."""
+        if 'task_master_001' not in self.agents:
+            return
+        
+        busy = {t.get('assigned_to') for t in self.task_manager.tasks.values()
+                if t.get('status') in ['pending', 'in_progress']}
+        idle_agents = tuple(sorted(
+            agent_id for agent_id, agent in self.agents.items()
+            if agent.active and agent_id not in busy
+            and agent_id not in ['eng_manager_001', 'task_master_001']
+        ))
+        if not idle_agents:
+            return
+        
+        completed = sum(1 for t in self.task_manager.tasks.values() if t.get('status') == 'completed')
+        workload = (idle_agents, completed)
+        if workload == self.last_workload:
+            logger.info("⏸️  Task Master: workload unchanged since last run, skipping")
+            return
+        
+        task_master = self.agents['task_master_001']
+        recent_completed = sorted(
+            [t for t in self.task_manager.tasks.values() if t.get('status') == 'completed'],
+            key=lambda x: x.get('completed_at', ''),
+            reverse=True
+        )[:10]
+        
+        prompt = f"""WORKLOAD CHECK - CYCLE #{self.cycle_count}
+
+😴 IDLE AGENTS ({len(idle_agents)}):
+{chr(10).join([f"- {agent_id} ({self.agents[agent_id].role.value})" for agent_id in idle_agents])}
+
+🎯 RECENT COMPLETIONS:
+{chr(10).join([f"- {t.get('title', 'Unknown')} by {t.get('assigned_to', 'Unknown')}" for t in recent_completed])}
+
+Create one specific, actionable task for each idle agent, matching their role.
+Respond with JSON in your usual output format (analysis, actions_taken, recommendations)."""
+        
+        try:
+            response = await self.gemini.generate(
+                agent_id=task_master.id,
+                system=task_master.system_prompt,
+                prompt=prompt,
+                temp=task_master.temperature
+            )
+            
+            data = self._extract_json(response) or {}
+            created = 0
+            for action in data.get('actions_taken', []):
+                if not isinstance(action, dict):
+                    continue
+                if action.get('action') != 'created_task' or not action.get('task'):
+                    continue
+                if action.get('agent_id') not in self.agents:
+                    continue
+                task = dict(action['task'])
+                task['assigned_to'] = action['agent_id']
+                task.setdefault('dependencies', [])
+                self.task_manager.create_task(task)
+                created += 1
+            
+            logger.info(f"📋 Atlas created {created} tasks for {len(idle_agents)} idle agents")
+            
+            # Only a run that produced tasks settles this workload; otherwise retry next cycle
+            if created:
+                self.last_workload = workload
+            
+        except Exception as e:
+            logger.error(f"❌ Task Master cycle failed: {e}")
+    
     async def _execute_all_tasks(self):
         """Execute all pending tasks in parallel (one per agent)"""
         
@@ -1432,15 +1586,23 @@ Please resubmit with proof of work.
         
         manager = self.agents['eng_manager_001']
         
-        for blocker_task in blockers[:3]:  # Process up to 3 blockers per cycle
-            agent_id = blocker_task.get('assigned_to')
-            blocker_reasons = blocker_task.get('blockers', [])
-            
-            if not blocker_reasons:
-                continue
-            
-            # Ask Marcus to help unblock
-            prompt = f"""BLOCKER RESOLUTION
+        # Each blocker is an independent LLM round-trip, so resolve them concurrently
+        # (up to 3 per cycle); one failure doesn't stop the others
+        await asyncio.gather(
+            *(self._resolve_blocker(manager, blocker_task) for blocker_task in blockers[:3]),
+            return_exceptions=True
+        )
+    
+    async def _resolve_blocker(self, manager, blocker_task: dict):
+        """Ask Marcus to help unblock one blocked task"""
+        agent_id = blocker_task.get('assigned_to')
+        blocker_reasons = blocker_task.get('blockers', [])
+        
+        if not blocker_reasons:
+            return
+        
+        # Ask Marcus to help unblock
+        prompt = f"""BLOCKER RESOLUTION
 
 AGENT: {agent_id}
 TASK: {blocker_task.get('title', 'Unknown')}
@@ -1467,49 +1629,49 @@ OUTPUT FORMAT:
 }}
 
 Help unblock NOW:"""
+        
+        try:
+            response = await self.gemini.generate(
+                agent_id=manager.id,
+                system=manager.system_prompt,
+                prompt=prompt,
+                temp=manager.temperature
+            )
             
-            try:
-                response = await self.gemini.generate(
-                    agent_id=manager.id,
-                    system=manager.system_prompt,
-                    prompt=prompt,
-                    temp=manager.temperature
-                )
-                
-                solution_data = self._extract_json(response)
-                
-                if solution_data:
-                    # Send unblocking message to agent
-                    from core.team_communication import Message
-                    await self.team_comm.send_message(
-                        Message(
-                            id=f"unblock_{blocker_task['id']}_{datetime.now().timestamp()}",
-                            from_agent='eng_manager_001',
-                            to_agent=agent_id,
-                            message_type="help_request",
-                            subject=f"Unblocking: {blocker_task.get('title', 'Unknown')}",
-                            content=f"""**Analysis:** {solution_data.get('analysis', '')}
+            solution_data = self._extract_json(response)
+            
+            if solution_data:
+                # Send unblocking message to agent
+                from core.team_communication import Message
+                await self.team_comm.send_message(
+                    Message(
+                        id=f"unblock_{blocker_task['id']}_{datetime.now().timestamp()}",
+                        from_agent='eng_manager_001',
+                        to_agent=agent_id,
+                        message_type="help_request",
+                        subject=f"Unblocking: {blocker_task.get('title', 'Unknown')}",
+                        content=f"""**Analysis:** {solution_data.get('analysis', '')}
 
 **Solution:** {solution_data.get('solution', '')}
 
 **Action Items:**
 {chr(10).join(['- ' + item for item in solution_data.get('action_items', [])])}""",
-                            timestamp=datetime.now().isoformat(),
-                            priority="high"
-                        )
+                        timestamp=datetime.now().isoformat(),
+                        priority="high"
                     )
-                    
-                    # Create helper tasks if needed
-                    if solution_data.get('helper_tasks'):
-                        for helper_task in solution_data['helper_tasks']:
-                            helper_task['priority'] = 1  # High priority for unblocking
-                            helper_task['dependencies'] = []
-                            self.task_manager.create_task(helper_task)
-                            logger.info(f"📋 Created helper task: {helper_task.get('title', 'Unknown')}")
-                    
-                    logger.info(f"✅ Unblocked: {blocker_task.get('title', 'Unknown')}")
-            except Exception as e:
-                logger.error(f"❌ Failed to process blocker: {e}")
+                )
+                
+                # Create helper tasks if needed
+                if solution_data.get('helper_tasks'):
+                    for helper_task in solution_data['helper_tasks']:
+                        helper_task['priority'] = 1  # High priority for unblocking
+                        helper_task['dependencies'] = []
+                        self.task_manager.create_task(helper_task)
+                        logger.info(f"📋 Created helper task: {helper_task.get('title', 'Unknown')}")
+                
+                logger.info(f"✅ Unblocked: {blocker_task.get('title', 'Unknown')}")
+        except Exception as e:
+            logger.error(f"❌ Failed to process blocker: {e}")
     
     async def _process_all_pending_reviews(self):
         """Process all pending code reviews - Marcus reviews everything"""
@@ -1664,7 +1826,7 @@ Review now:"""
                 })
             else:
                 # String action - just log for now
-            logger.info(f"🔧 {agent.name} executing: {action}")
+                logger.info(f"🔧 {agent.name} executing: {action}")
             
         # Run tests if test_coverage is mentioned
         if result_data.get('test_coverage') is not None:
@@ -1979,7 +2141,9 @@ async def main():
         if not github_repo:
             try:
                 import subprocess
-                result = subprocess.run(
+                # In a thread so the git call doesn't block the API's event loop
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     ['git', 'config', '--get', 'remote.origin.url'],
                     capture_output=True,
                     text=True,
@@ -2000,7 +2164,8 @@ async def main():
         github_branch = 'main'
         try:
             import subprocess
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
                 capture_output=True,
                 text=True,
@@ -5,10 +5,10 @@ Talk to agents, approve deployments, control the system
 
 import asyncio
 import logging
+from dataclasses import replace
 from datetime import datetime
 from typing import Optional
 import os
-import json
 from pathlib import Path
 
 logger = logging.getLogger('TelegramInterface')
@@ -218,17 +218,12 @@ Respond directly, professionally, and concisely. Use your core values (intellect
         reason = ' '.join(args[1:]) if len(args) > 1 else "Rejected by human"
         
         # Mark as failed
-        deploy_file = self.orchestrator.env_manager.deployments_dir / f"{deployment_id}.json"
-        if deploy_file.exists():
-            with open(deploy_file) as f:
-                deploy_data = json.load(f)
-            
-            deploy_data['status'] = 'failed'
-            deploy_data['rejection_reason'] = reason
-            
-            with open(deploy_file, 'w') as f:
-                json.dump(deploy_data, f, indent=2)
-            
+        try:
+            rejected = await self.orchestrator.env_manager.reject_deployment(deployment_id, reason)
+        except ValueError as e:
+            return f"❌ {e}"
+        
+        if rejected:
             return f"❌ Deployment {deployment_id} rejected.\nReason: {reason}"
         
         return f"❌ Deployment {deployment_id} not found"
@@ -261,8 +256,9 @@ Respond directly, professionally, and concisely. Use your core values (intellect
         if agent.active:
             return f"✅ {agent.name} is already active"
         
-        # Activate the Mango
-        agent.active = True
+        # Activate the Mango (agent configs are frozen, so swap in an active copy)
+        agent = replace(agent, active=True)
+        self.orchestrator.agents[mango_id] = agent
         
         return f"""
 🚀 <b>ACTIVATED: {agent.name}</b>
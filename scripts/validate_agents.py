@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Validate the agent definitions (config/agent_definitions.py, config/_agent_specs.py)
+Run before committing changes to agents; exits non-zero on any problem.
+The runtime registry trusts these invariants instead of re-checking them.
+"""
+
+import ast
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from config import agent_definitions as ad  # noqa: E402
+
+SPECS_FILE = ROOT / "config" / "_agent_specs.py"
+PROMPTS_DIR = ROOT / "config" / "prompts"
+
+def find_duplicate_ids():
+    """Find ids declared twice in AGENT_SPECS (a dict literal keeps only the last one)"""
+    tree = ast.parse(SPECS_FILE.read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.AnnAssign) and getattr(node.target, "id", None) == "AGENT_SPECS":
+            keys = [key.value for key in node.value.keys]
+            return sorted({key for key in keys if keys.count(key) > 1})
+    return ["AGENT_SPECS not found"]
+
+def check_specs():
+    """Check each spec builds a well-formed AgentConfig"""
+    errors = []
+    for agent_id in ad._specs():
+        try:
+            agent = ad.get_agent(agent_id)
+        except TypeError as e:
+            errors.append(f"{agent_id}: {e}")
+            continue
+
+        if not isinstance(agent.type, ad.AgentType):
+            errors.append(f"{agent_id}: type is not an AgentType")
+        if not isinstance(agent.role, ad.AgentRole):
+            errors.append(f"{agent_id}: role is not an AgentRole")
+        unknown_tools = [tool for tool in agent.tools if not isinstance(tool, ad.Tool)]
+        if unknown_tools:
+            errors.append(f"{agent_id}: tools not in Tool enum: {unknown_tools}")
+        if not 0.0 <= agent.temperature <= 2.0:
+            errors.append(f"{agent_id}: temperature {agent.temperature} outside 0.0-2.0")
+        has_file = (PROMPTS_DIR / f"{agent_id}.txt").exists()
+        if agent.prompt is not None and has_file:
+            errors.append(f"{agent_id}: both an inline prompt and config/prompts/{agent_id}.txt")
+        elif agent.prompt is None and not has_file:
+            errors.append(f"{agent_id}: missing prompt file config/prompts/{agent_id}.txt")
+        elif not agent.system_prompt.strip():
+            errors.append(f"{agent_id}: empty system prompt")
+    return errors
+
+def main():
+    """Run all checks and report"""
+    print("🥭 Validating agent definitions...")
+    errors = []
+
+    duplicates = find_duplicate_ids()
+    if duplicates:
+        errors.append(f"Duplicate agent ids: {', '.join(duplicates)}")
+
+    errors.extend(check_specs())
+
+    # MANGO_AGENTS_BY_ROLE maps each role to a single Mango
+    mango_roles = [spec["role"] for spec in ad._specs().values() if spec["type"] is ad.AgentType.MANGO]
+    shared_roles = sorted({role.value for role in mango_roles if mango_roles.count(role) > 1})
+    if shared_roles:
+        errors.append(f"Roles shared by several Mangoes: {', '.join(shared_roles)}")
+
+    orphans = sorted(p.stem for p in PROMPTS_DIR.glob("*.txt") if p.stem not in ad._specs())
+    if orphans:
+        errors.append(f"Prompt files without an agent: {', '.join(orphans)}")
+
+    # Unknown dependencies and cycles
+    try:
+        waves = ad._launch_waves()
+    except ad.ConfigError as e:
+        errors.append(str(e))
+        waves = []
+
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        return 1
+
+    print(f"✅ {len(ad._specs())} agents OK ({len(waves)} launch waves)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())